@@ -83,6 +83,14 @@ class AwkwardArray(awkward.util.NDArrayOperatorsMixin):
         awkward.persist.serialize(self, state)
         return (awkward.persist.deserialize, (state,))
 
+    def __reduce_ex__(self, protocol):
+        if protocol < 5:
+            return self.__reduce__()
+        # protocol 5 pickles the Numpy arrays in state out-of-band (zero-copy with a buffer_callback): leave them uncompressed
+        state = {}
+        awkward.persist.serialize(self, state, compression=None)
+        return (awkward.persist.deserialize, (state,))
+
     def _checkiter(self):
         if not self.allow_iter:
             raise RuntimeError("awkward.array.base.AwkwardArray.allow_iter is False; refusing to iterate")
@@ -615,6 +623,8 @@ class AwkwardArray(awkward.util.NDArrayOperatorsMixin):
             raise TypeError("column selection must be str, not bytes, in Python 3")
         elif isinstance(where, tuple):
             return False
+        elif isinstance(where, list):
+            return len(where) > 0 and all(isinstance(x, awkward.util.string) for x in where)
         elif isinstance(where, (cls.numpy.ndarray, AwkwardArray)) and issubclass(where.dtype.type, (numpy.str, numpy.str_)):
             return True
         elif isinstance(where, (cls.numpy.ndarray, AwkwardArray)) and issubclass(where.dtype.type, (numpy.object, numpy.object_)) and not issubclass(where.dtype.type, (numpy.bool, numpy.bool_)):
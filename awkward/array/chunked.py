@@ -129,6 +129,24 @@ class ChunkedArray(awkward.array.base.AwkwardArray):
             self._types[at] = awkward.type.fromarray(chunk).to
         return self._types[at]
 
+    def prefetch(self, start=0, stop=None, executor=None):
+        # materialize the VirtualArrays in chunks [start, stop) (or in those chunks' Table columns); with an executor
+        # (e.g. concurrent.futures.ThreadPoolExecutor) and a reader like Parquet that decodes without the GIL, they load concurrently
+        virtuals = []
+        for chunk in self._chunks[start:stop]:
+            if isinstance(chunk, self.VirtualArray):
+                virtuals.append(chunk)
+            elif isinstance(chunk, self.Table):
+                virtuals.extend(x for x in chunk._contents.values() if isinstance(x, self.VirtualArray))
+        virtuals = [x for x in virtuals if not x.ismaterialized]
+
+        if executor is None:
+            for x in virtuals:
+                x.array
+        else:
+            list(executor.map(lambda x: x.array, virtuals))
+        return self
+
     def global2chunkid(self, index, return_normalized=False):
         self._valid()
 
@@ -464,9 +482,13 @@ class ChunkedArray(awkward.array.base.AwkwardArray):
                     self.knowchunksizes(chunkid.max() + 1)
                     offsets = self.offsets
 
-                    for cid in self.numpy.unique(chunkid):
-                        mask = (chunkid == cid)
-                        out[mask] = self._chunks[cid][head[mask] - offsets[cid]]
+                    # group the indexes by chunk with one stable sort, rather than a mask per chunk
+                    order = self.numpy.argsort(chunkid, kind="mergesort")
+                    cids, bounds = self.numpy.unique(chunkid[order], return_index=True)
+                    bounds = list(bounds) + [len(order)]
+                    for i, cid in enumerate(cids):
+                        which = order[bounds[i]:bounds[i + 1]]
+                        out[which] = self._chunks[cid][head[which] - offsets[cid]]
 
                     if tail == ():
                         return out
@@ -953,25 +975,30 @@ class AppendableArray(ChunkedArray):
         raise TypeError("array has no Table, cannot remove columns")
 
     def append(self, value):
-        if len(self._chunks) == 0 or self._chunksizes[-1] == len(self._chunks[-1]):
+        chunksizes = self._chunksizes
+        if len(chunksizes) == 0 or chunksizes[-1] == len(self._chunks[-1]):
             self._types.append(None)
-            self._chunksizes.append(0)
+            chunksizes.append(0)
             self._chunks.append(self.numpy.empty(self._chunkshape, dtype=self._dtype))
 
-        self._chunks[-1][self._chunksizes[-1]] = value
-        self._chunksizes[-1] += 1
+        self._chunks[-1][chunksizes[-1]] = value
+        chunksizes[-1] += 1
 
     def extend(self, values):
-        while len(values) > 0:
+        # convert once and step through it: slicing off the rest of a list per chunk is quadratic
+        if not isinstance(values, self.numpy.ndarray):
+            values = self.numpy.asarray(values, dtype=self._dtype)
+        start = 0
+        while start < len(values):
             if len(self._chunks) == 0 or self._chunksizes[-1] == len(self._chunks[-1]):
                 self._types.append(None)
                 self._chunksizes.append(0)
                 self._chunks.append(self.numpy.empty(self._chunkshape, dtype=self._dtype))
 
-            howmany = min(len(values), len(self._chunks[-1]) - self._chunksizes[-1])
-            self._chunks[-1][self._chunksizes[-1] : self._chunksizes[-1] + howmany] = values[:howmany]
+            howmany = min(len(values) - start, len(self._chunks[-1]) - self._chunksizes[-1])
+            self._chunks[-1][self._chunksizes[-1] : self._chunksizes[-1] + howmany] = values[start : start + howmany]
             self._chunksizes[-1] += howmany
-            values = values[howmany:]
+            start += howmany
 
     def _hasjagged(self):
         return False
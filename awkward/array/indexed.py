@@ -559,8 +559,9 @@ class SparseArray(awkward.array.base.AwkwardArrayWithContent):
                 length = 0
 
             if abs(step) > 1:
-                index, remainder = self.numpy.divmod(index, abs(step))
-                mask[remainder != 0] = False
+                remainder = self.numpy.empty_like(index)
+                self.numpy.divmod(index, abs(step), out=(index, remainder))    # index is already a temporary
+                mask &= (remainder == 0)
 
             index = index[mask]
             content = self._content[mask]
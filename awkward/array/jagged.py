@@ -17,6 +17,9 @@ import awkward.persist
 import awkward.type
 import awkward.util
 
+# number of content items per block when filling parents from non-contiguous starts/stops
+_parentstile = 65536
+
 class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
     """
     JaggedArray
@@ -24,24 +27,50 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
 
     @classmethod
     def offsetsaliased(cls, starts, stops):
+        # starts and stops are offsets[:-1] and offsets[1:] of one offsets array, which may itself be a view
         return (isinstance(starts, cls.numpy.ndarray) and isinstance(stops, cls.numpy.ndarray) and
                 starts.base is not None and stops.base is not None and starts.base is stops.base and
-                starts.ctypes.data == starts.base.ctypes.data and
-                stops.ctypes.data == stops.base.ctypes.data + stops.dtype.itemsize and
-                len(starts) == len(starts.base) - 1 and
-                len(stops) == len(stops.base) - 1)
+                len(starts.shape) == len(stops.shape) == 1 and len(starts) == len(stops) > 0 and
+                starts.dtype == stops.dtype and starts.strides == stops.strides == (starts.dtype.itemsize,) and
+                stops.ctypes.data == starts.ctypes.data + starts.dtype.itemsize)
 
     @classmethod
-    def counts2offsets(cls, counts):
-        offsets = cls.numpy.empty(len(counts) + 1, dtype=cls.JaggedArray.fget(None).INDEXTYPE)
+    def _aliasedoffsets(cls, starts):
+        # the offsets array behind offsetsaliased starts: their base if it is exactly that, otherwise a view spanning them
+        base = starts.base
+        if (isinstance(base, cls.numpy.ndarray) and base.dtype == starts.dtype and base.strides == starts.strides and
+            len(base.shape) == 1 and len(base) == len(starts) + 1 and base.ctypes.data == starts.ctypes.data):
+            return base
+        else:
+            return cls.numpy.lib.stride_tricks.as_strided(starts, shape=(len(starts) + 1,), writeable=starts.flags.writeable)
+
+    @classmethod
+    def counts2offsets(cls, counts, dtype=None):
+        if dtype is None:
+            dtype = cls.JaggedArray.fget(None).INDEXTYPE
+        offsets = cls.numpy.empty(len(counts) + 1, dtype=dtype)
         offsets[0] = 0
-        cls.numpy.cumsum(counts, out=offsets[1:])
+        cls.numpy.cumsum(counts, dtype=offsets.dtype, out=offsets[1:])    # accumulate in INDEXTYPE, not the platform int
+        return offsets
+
+    @classmethod
+    def _startsstops2offsets(cls, starts, stops):
+        # for contiguous, non-empty starts/stops; one allocation, unlike numpy.append
+        if starts.dtype == stops.dtype:
+            dtype = starts.dtype    # don't widen narrow (e.g. int32) indexes
+        else:
+            dtype = cls.JaggedArray.fget(None).INDEXTYPE
+        offsets = cls.numpy.empty(len(starts) + 1, dtype=dtype)
+        offsets[:-1] = starts
+        offsets[-1] = stops[-1]
         return offsets
 
     @classmethod
     def offsets2parents(cls, offsets):
         dtype = cls.JaggedArray.fget(None).INDEXTYPE
-        counts = cls.numpy.diff(cls.numpy.r_[dtype.type(0), offsets])  # numpy >= 1.16: diff prepend
+        counts = cls.numpy.empty(len(offsets), dtype=dtype)
+        counts[:1] = offsets[:1]                                      # content before the first offset has parent -1
+        cls.numpy.subtract(offsets[1:], offsets[:-1], out=counts[1:])
         indices = cls.numpy.arange(-1, len(offsets) - 1, dtype=dtype)
         return cls.numpy.repeat(indices, awkward.util.windows_safe(counts))
 
@@ -52,14 +81,19 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
         stops = stops.reshape(-1)
         dtype = cls.JaggedArray.fget(None).INDEXTYPE
         out = cls.numpy.full(stops.max(), -1, dtype=dtype)
-        indices = cls.numpy.arange(len(starts), dtype=dtype)
         counts = stops - starts
-        parents = cls.numpy.repeat(indices, awkward.util.windows_safe(counts))
         contiguous_offsets = cls.JaggedArray.fget(None).counts2offsets(counts)
-        content_indices = cls.numpy.arange(contiguous_offsets[-1])
-        content_indices -= cls.numpy.repeat(contiguous_offsets[:-1], awkward.util.windows_safe(counts))
-        content_indices += starts[parents]
-        cls.numpy.put(out, awkward.util.windows_safe(content_indices), parents)
+        shifts = starts - contiguous_offsets[:-1]     # content index minus contiguous index, per subarray
+
+        # fill in blocks of whole subarrays, about _parentstile items each, so that the temporaries stay in cache
+        blocks = cls.numpy.searchsorted(contiguous_offsets, cls.numpy.arange(0, contiguous_offsets[-1], _parentstile), side="right") - 1
+        blocks = cls.numpy.unique(cls.numpy.append(blocks, len(counts)))
+        for i, j in zip(blocks[:-1], blocks[1:]):
+            blockcounts = awkward.util.windows_safe(counts[i:j])
+            parents = cls.numpy.repeat(cls.numpy.arange(i, j, dtype=dtype), blockcounts)
+            content_indices = cls.numpy.arange(contiguous_offsets[i], contiguous_offsets[j], dtype=dtype)
+            content_indices += cls.numpy.repeat(shifts[i:j], blockcounts)
+            out[content_indices] = parents
         return out
 
     @classmethod
@@ -105,7 +139,7 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
         if self.offsetsaliased(starts, stops):
             self.content = content
             self._starts, self._stops = starts, stops
-            self._offsets = starts.base
+            self._offsets = self._aliasedoffsets(starts)
             self._counts, self._parents = None, None
             self._isvalid = False
 
@@ -134,21 +168,25 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
     @classmethod
     def fromoffsets(cls, offsets, content):
         offsets = cls._util_toarray(offsets, cls.INDEXTYPE, cls.numpy.ndarray)
-        if offsets.base is not None:
-            # We rely on the starts,stops slices to be views.
-            # If offsets is already a view, the base will not be offsets but its underlying base.
-            # Make a copy to prevent that
-            offsets = offsets.copy()
-        return cls(offsets[:-1], offsets[1:], content)
+        out = cls(offsets[:-1], offsets[1:], content)
+        if out._offsets is not None:
+            out._offsets = offsets    # even if offsets is a view (offsetsaliased doesn't need a copy)
+        return out
 
     @classmethod
-    def fromcounts(cls, counts, content):
+    def fromcounts(cls, counts, content, dtype=None):
         counts = cls._util_toarray(counts, cls.INDEXTYPE, cls.numpy.ndarray)
         if not cls._util_isintegertype(counts.dtype.type):
             raise TypeError("counts must have integer dtype")
-        if (counts < 0).any():
+        if counts.size > 0 and counts.min() < 0:
             raise ValueError("counts must be a non-negative array")
-        offsets = cls.counts2offsets(counts.reshape(-1))
+        if dtype is not None:
+            dtype = cls.numpy.dtype(dtype)
+            if not cls._util_isintegertype(dtype.type):
+                raise TypeError("dtype must be an integer type")
+            if counts.size > 0 and counts.sum(dtype=cls.INDEXTYPE) > cls.numpy.iinfo(dtype).max:
+                raise ValueError("total count {0} does not fit in {1} offsets".format(counts.sum(dtype=cls.INDEXTYPE), dtype))
+        offsets = cls.counts2offsets(counts.reshape(-1), dtype=dtype)
         out = cls(offsets[:-1].reshape(counts.shape), offsets[1:].reshape(counts.shape), content)
         out._offsets = offsets if len(counts.shape) == 1 else None
         out._counts = counts
@@ -343,12 +381,12 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
         if self._offsets is None:
             self._valid()
             if self.offsetsaliased(self._starts, self._stops):
-                self._offsets = self._starts.base
+                self._offsets = self._aliasedoffsets(self._starts)
             elif len(self._starts.shape) == 1 and self.numpy.array_equal(self._starts[1:], self._stops[:-1]):
                 if len(self._stops) == 0:
                     return self.numpy.array([0], dtype=self.INDEXTYPE)
                 else:
-                    self._offsets = self.numpy.append(self._starts, self._stops[-1])
+                    self._offsets = self._startsstops2offsets(self._starts, self._stops)
             else:
                 raise ValueError("starts and stops are not compatible with a single offsets array")
         return self._offsets
@@ -431,13 +469,24 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
             out -= self.numpy.repeat(offsets[:-1], awkward.util.windows_safe(counts))
             return self.JaggedArray(offsets[:-1].reshape(self.shape), offsets[1:].reshape(self.shape), out)
 
+    def _flatindex(self):
+        # content index of every item, in order: localindex + starts without building the jagged broadcast;
+        # empty subarrays contribute no items, so they are dropped before the repeat
+        counts = self.counts.reshape(-1)
+        offsets = self.counts2offsets(counts)
+        nonempty = (counts > 0)
+        shifts = self._starts.reshape(-1)[nonempty] - offsets[:-1][nonempty]
+        out = self.numpy.arange(offsets[-1], dtype=self.INDEXTYPE)
+        out += self.numpy.repeat(shifts, awkward.util.windows_safe(counts[nonempty]))
+        return out
+
     def _getnbytes(self, seen):
         if id(self) in seen:
             return 0
         else:
             seen.add(id(self))
             if self.offsetsaliased(self._starts, self._stops):
-                return self._starts.base.nbytes + (self._content.nbytes if isinstance(self._content, self.numpy.ndarray) else self._content._getnbytes(seen))
+                return (len(self._starts) + 1)*self._starts.dtype.itemsize + (self._content.nbytes if isinstance(self._content, self.numpy.ndarray) else self._content._getnbytes(seen))
             else:
                 return self._starts.nbytes + self._stops.nbytes + (self._content.nbytes if isinstance(self._content, self.numpy.ndarray) else self._content._getnbytes(seen))
 
@@ -458,12 +507,15 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
     def _valid(self):
         if not self._isvalid:
             if self.offsetsaliased(self._starts, self._stops):
-                self._offsets = self._starts.base
+                self._offsets = self._aliasedoffsets(self._starts)
                 if self.check_whole_valid:
                     if not (self._offsets[1:] >= self._offsets[:-1]).all():
                         raise ValueError("offsets must be monatonically increasing")
-                    if self._offsets.max() > len(self._content):
-                        raise ValueError("maximum offset {0} is beyond the length of the content ({1})".format(self._offsets.max(), len(self._content)))
+                    # empty subarrays may point anywhere, as in the general case below
+                    stops = self._offsets[1:]
+                    stops = stops[stops > self._offsets[:-1]]
+                    if len(stops) != 0 and stops.max() > len(self._content):
+                        raise ValueError("maximum offset {0} is beyond the length of the content ({1})".format(stops.max(), len(self._content)))
 
             else:
                 if self.check_whole_valid:
@@ -577,8 +629,7 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
                 return self.copy(starts=offsets[:-1].reshape(intheadsum.shape), stops=offsets[1:].reshape(intheadsum.shape), content=thyself._content[headcontent])
 
             elif head.shape == self.shape and issubclass(head._content.dtype.type, (self.numpy.bool, self.numpy.bool_)):
-                index = self.localindex + self.starts
-                flatindex = index.flatten()[head.flatten()]
+                flatindex = self._flatindex()[head.flatten()]
                 return self.JaggedArray.fromcounts(head.sum(), self._content[flatindex])
 
             else:
@@ -586,11 +637,21 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
 
         else:
             starts = self._starts[head]
-            stops = self._stops[head]
+            stops = self.stops[head]
             if len(starts.shape) == len(stops.shape) == 0:
                 return self._content[starts:stops][tail]
             else:
-                node = self.copy(starts=starts, stops=stops)
+                # a selection of our (already validated) starts and stops is valid, too: skip the setters' checks
+                node = self.copy()
+                node._starts, node._stops = starts, stops
+                node._offsets, node._counts, node._parents = None, None, None
+                if len(head) == 1 and isinstance(head[0], slice) and head[0].step in (None, 1) and (self._offsets is not None or self.offsetsaliased(self._starts, self._stops)):
+                    # a step-1 slice of contiguous subarrays keeps a slice of our offsets, rather than rediscovering them later
+                    start, stop, step = head[0].indices(len(self._starts))
+                    if start < stop:
+                        node._offsets = self.offsets[start : stop + 1]
+                        if self._counts is not None:
+                            node._counts = self._counts[start:stop]
 
         head = head[-1]
 
@@ -607,7 +668,7 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
                     node = node.flatten()
 
                 if isinstance(node, JaggedArray):
-                    counts = node.stops - node._starts
+                    counts = node.counts
                     if head < 0:
                         head = counts + head
                     if not self.numpy.bitwise_and(0 <= head, head < counts).all():
@@ -628,7 +689,7 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
                 if len(node) == 0:
                     return node
 
-                counts = node.stops - node._starts
+                counts = node.counts
                 step = 1 if head.step is None else head.step
 
                 if step == 0:
@@ -651,6 +712,11 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
 
                     stops = self.numpy.maximum(starts, stops)
 
+                    if step == 1:
+                        # contiguous inner slice: only starts and stops move, content is shared
+                        node = node.copy(starts=node._starts + starts, stops=node._starts + stops)
+                        continue
+
                     start = starts.min()
                     stop = stops.max()
                     indexes = self.numpy.empty((len(node), abs(stop - start)), dtype=self.INDEXTYPE)
@@ -800,7 +866,9 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
                 whereoffsets = self.counts2offsets(where.counts)
                 where = where._tojagged(whereoffsets[:-1], whereoffsets[1:], copy=False)
 
-                counts = where.tojagged(self.counts)._content
+                # where is compact now: one parents array broadcasts both counts and starts
+                parents = self.offsets2parents(whereoffsets)
+                counts = self.counts[parents]
 
                 indexes = self.numpy.array(where._content[:whereoffsets[-1]], copy=True)
 
@@ -810,13 +878,19 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
                 if not self.numpy.bitwise_and(0 <= indexes, indexes < counts).all():
                     raise IndexError("jagged array used as index contains out-of-bounds values")
 
-                indexes += where.tojagged(self._starts)._content
+                indexes += self._starts[parents]
 
                 self._content[indexes] = what
 
             elif issubclass(where._content.dtype.type, (self.numpy.bool, self.numpy.bool_)):
-                index = self.localindex + self.starts
-                flatindex = index.flatten()[where.flatten()]
+                if len(self._starts.shape) == 1 and self._canuseoffset():
+                    # contiguous: the selected positions are the mask's nonzero positions, shifted
+                    mask = where.flatten()
+                    if len(mask) != self.offsets[-1] - self.offsets[0]:
+                        raise IndexError("jagged array used as mask has different counts from the jagged array it is selecting from")
+                    flatindex = self.numpy.nonzero(mask)[0] + self.offsets[0]
+                else:
+                    flatindex = self._flatindex()[where.flatten()]
                 self._content[flatindex] = what
 
             else:
@@ -827,12 +901,15 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
 
     def tojagged(self, data):
         if isinstance(data, JaggedArray):
-            selfcounts = self.stops - self._starts
-            datacounts = data.stops - data._starts
+            selfcounts = self.counts
+            datacounts = data.counts
             if not self.numpy.array_equal(selfcounts, datacounts):
                 raise ValueError("cannot broadcast JaggedArray to match JaggedArray with a different counts")
             if len(self._starts) == 0:
                 return self.copy(content=data._content)
+            if self._sameview(self._starts, data._starts) or self.numpy.array_equal(self._starts, data._starts):
+                # same starts and counts: data's content is already aligned with ours
+                return self.copy(content=data._content)
 
             tmp = self.compact()
             tmpparents = self.offsets2parents(tmp.offsets)
@@ -868,6 +945,13 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
         else:
             return self.tojagged(self.numpy.array([data]))
 
+    @classmethod
+    def _sameview(cls, one, two):
+        # views of the same memory with the same layout are equal without comparing their elements
+        return one is two or (isinstance(one, cls.numpy.ndarray) and isinstance(two, cls.numpy.ndarray) and
+                              one.dtype == two.dtype and one.shape == two.shape and one.strides == two.strides and
+                              one.ctypes.data == two.ctypes.data)
+
     def _tojagged(self, starts=None, stops=None, copy=True):
         if starts is None and stops is None:
             if copy:
@@ -896,25 +980,25 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
                 raise ValueError("cannot fit contents of JaggedArray into the given stops array")
 
         else:
-            if not self.numpy.array_equal(stops - starts, self.counts):
+            if not (self._sameview(starts, self._starts) and self._sameview(stops, self._stops)) and not self.numpy.array_equal(stops - starts, self.counts):
                 raise ValueError("cannot fit contents of JaggedArray into the given starts and stops arrays")
 
-        self._validstartsstops(starts, stops)
-
-        if not copy and starts is self._starts and stops is self._stops:
+        if not copy and self._sameview(starts, self._starts) and self._sameview(stops, self._stops):
             return self
 
-        elif (starts is self._starts or self.numpy.array_equal(starts, self._starts)) and (stops is self._stops or self.numpy.array_equal(stops, self._stops)):
+        self._validstartsstops(starts, stops)
+
+        if (self._sameview(starts, self._starts) or self.numpy.array_equal(starts, self._starts)) and (self._sameview(stops, self._stops) or self.numpy.array_equal(stops, self._stops)):
             return self.copy(starts=starts, stops=stops, content=(self._util_deepcopy(self._content) if copy else self._content))
 
         else:
             if self.offsetsaliased(starts, stops):
-                parents = self.offsets2parents(starts.base)
+                parents = self.offsets2parents(self._aliasedoffsets(starts))
             elif len(starts.shape) == 1 and self.numpy.array_equal(starts[1:], stops[:-1]):
                 if len(stops) == 0:
                     offsets = self.numpy.array([0], dtype=self.INDEXTYPE)
                 else:
-                    offsets = self.numpy.append(starts, stops[-1])
+                    offsets = self._startsstops2offsets(starts, stops)
                 parents = self.offsets2parents(offsets)
             else:
                 parents = self.startsstops2parents(starts, stops)
@@ -977,7 +1061,7 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
 
         for jaggedarray in inputs:
             if isinstance(jaggedarray, JaggedArray):
-                starts, stops, parents, good = jaggedarray._starts, jaggedarray._stops, None, None
+                starts, stops, parents, good, repeats = jaggedarray._starts, jaggedarray._stops, None, None, None
                 break
         else:
             assert False
@@ -988,11 +1072,15 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
                 if starts.shape != data.shape:
                     raise ValueError("cannot broadcast JaggedArray of shape {0} with array of shape {1}".format(starts.shape, data.shape))
 
-                if parents is None:
-                    parents = jaggedarray.parents
+                if parents is None and repeats is None:
                     if self._canuseoffset() and len(jaggedarray.starts) > 0 and jaggedarray.starts[0] == 0:
-                        good = None
+                        if jaggedarray._parents is None:
+                            # contiguous from zero: repeat each value over its counts rather than building parents
+                            repeats = jaggedarray.counts.reshape(-1)
+                        else:
+                            parents = jaggedarray._parents
                     else:
+                        parents = jaggedarray.parents
                         good = (parents >= 0)
 
                 def recurse(x):
@@ -1005,6 +1093,13 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
                             content[n] = recurse(x[n])
                         return content
 
+                    elif repeats is not None:
+                        if len(x.shape) == 0:
+                            content = self.numpy.full(repeats.sum(), x, dtype=x.dtype)
+                        else:
+                            content = self.numpy.repeat(x.reshape(-1), repeats)
+                        return content
+
                     elif good is None:
                         if len(x.shape) == 0:
                             content = self.numpy.full(len(parents), x, dtype=x.dtype)
@@ -1030,13 +1125,26 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
 
         result = getattr(ufunc, method)(*inputs, **kwargs)
 
-        counts = stops - starts
+        counts = jaggedarray.counts
+        if len(counts.shape) == 1 and jaggedarray._canuseoffset():
+            # the flattened inputs follow our offsets: share them and the cached counts, rather than a cumsum per output
+            offsets = jaggedarray.offsets
+            if offsets[0] != 0:
+                offsets = offsets - offsets[0]
+            def wrap(x):
+                out = self.Methods.maybemixin(type(x), self.JaggedArray).fromoffsets(offsets, x)
+                out._counts = counts
+                return out
+        else:
+            def wrap(x):
+                return self.Methods.maybemixin(type(x), self.JaggedArray).fromcounts(counts, x)
+
         if isinstance(result, tuple):
-            return tuple(self.Methods.maybemixin(type(x), self.JaggedArray).fromcounts(counts, x) if isinstance(x, (self.numpy.ndarray, awkward.array.base.AwkwardArray)) else x for x in result)
+            return tuple(wrap(x) if isinstance(x, (self.numpy.ndarray, awkward.array.base.AwkwardArray)) else x for x in result)
         elif method == "at":
             return None
         else:
-            return self.Methods.maybemixin(type(result), self.JaggedArray).fromcounts(counts, result)
+            return wrap(result)
 
     def regular(self):
         self._valid()
@@ -1302,10 +1410,11 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
 
         ocp = other.counts[parents]
         iop = indexes - offsets[parents]
-        iop_ocp = iop // ocp
+        iop_ocp = self.numpy.empty_like(iop)
+        self.numpy.divmod(iop, ocp, out=(iop_ocp, iop))    # one pass for quotient and remainder
 
         left = self._starts[parents] + iop_ocp
-        right = other._starts[parents] + iop - ocp * iop_ocp
+        right = other._starts[parents] + iop
 
         out = self.JaggedArray.fromoffsets(offsets, self.Table.named("tuple", left, right))
         out._offsets = offsets
@@ -1352,7 +1461,15 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
 
     def _canuseoffset(self):
         self._valid()
-        return self.offsetsaliased(self._starts, self._stops) or (len(self._starts.shape) == 1 and self.numpy.array_equal(self._starts[1:], self.stops[:-1]))
+        if self._offsets is not None or self.offsetsaliased(self._starts, self._stops):
+            return True
+        elif len(self._starts.shape) == 1 and self.numpy.array_equal(self._starts[1:], self._stops[:-1]):
+            if len(self._stops) != 0:
+                # remember only the offsets (starts and stops stay as given), so the next check is O(1)
+                self._offsets = self._startsstops2offsets(self._starts, self._stops)
+            return True
+        else:
+            return False
 
     @property
     def iscompact(self):
@@ -1493,7 +1610,9 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
             offsets = self.counts2offsets(thyself.counts)
             thyself = thyself._tojagged(offsets[:-1], offsets[1:], copy=False)
 
-        content = thyself._content
+        # only the range the subarrays cover: a small slice of a big array shouldn't reduce (or nan-check) all of it
+        offsets = thyself.offsets
+        content = thyself._content[offsets[0]:offsets[-1]]
         if ufunc is None:
             ufunc = self.numpy.add
             if issubclass(content.dtype.type, (self.numpy.floating, self.numpy.complexfloating)):
@@ -1533,7 +1652,8 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
         out = self.numpy.empty(thyself._starts.shape[:1], dtype=dtype)
 
         if len(out) != 0:
-            nonterminal = thyself.offsets[thyself.offsets < len(content)]
+            starts = offsets[:-1] if offsets[0] == 0 else offsets[:-1] - offsets[0]
+            nonterminal = starts[:self.numpy.searchsorted(starts, len(content))]    # starts are sorted
 
             for axis in range(1, len(content.shape)):
                 content = ufunc.reduce(content, axis=axis)
@@ -5,10 +5,31 @@
 import collections
 import numbers
 
+import numpy
+
 import awkward.array.base
 import awkward.type
 import awkward.util
 
+# LSB-first (lsborder=True) bit order by byte lookup, rather than reversing unpackbits/packbits in groups of 8
+_lsbunpack = ((numpy.arange(256, dtype=numpy.uint8).reshape(-1, 1) >> numpy.arange(8, dtype=numpy.uint8)) & 1).astype(numpy.uint8)
+_reversebits = numpy.packbits(_lsbunpack, axis=1).reshape(-1)
+
+# numpy >= 1.17 packs and unpacks LSB-first itself, in one pass without the lookups
+try:
+    numpy.unpackbits(numpy.zeros(1, dtype=numpy.uint8), bitorder="little")
+except TypeError:
+    _littlebitorder = False
+else:
+    _littlebitorder = True
+
+def _lsbunpackbits(numpy, bitmask):
+    bitmask = numpy.asarray(bitmask)
+    if _littlebitorder and bitmask.dtype == numpy.uint8:
+        return numpy.unpackbits(bitmask, bitorder="little")
+    else:
+        return numpy.take(_lsbunpack, bitmask, axis=0).reshape(-1)
+
 class MaskedArray(awkward.array.base.AwkwardArrayWithContent):
     """
     MaskedArray
@@ -493,9 +514,10 @@ class BitMaskedArray(MaskedArray):
 
     @classmethod
     def bit2bool(cls, bitmask, lsborder=False):
-        out = cls.numpy.unpackbits(bitmask)
         if lsborder:
-            out = out.reshape(-1, 8)[:,::-1].reshape(-1)
+            out = _lsbunpackbits(cls.numpy, bitmask)
+        else:
+            out = cls.numpy.unpackbits(bitmask)
         return out.view(cls.MASKTYPE)
 
     @classmethod
@@ -506,23 +528,13 @@ class BitMaskedArray(MaskedArray):
         if not issubclass(boolmask.dtype.type, (cls.numpy.bool_, cls.numpy.bool)):
             boolmask = (boolmask != 0)
 
+        # numpy.packbits encodes as msb (most significant bit); lsb is the same with each byte's bits reversed
+        if lsborder and _littlebitorder:
+            return cls.numpy.packbits(boolmask, bitorder="little")
+        out = cls.numpy.packbits(boolmask)
         if lsborder:
-            # maybe pad the length for reshape
-            length = cls._ceildiv8(len(boolmask)) * 8
-            if length != len(boolmask):
-                out = cls.numpy.empty(length, dtype=boolmask.dtype)
-                out[:len(boolmask)] = boolmask
-            else:
-                out = boolmask
-
-            # reverse the order in groups of 8
-            out = out.reshape(-1, 8)[:,::-1].reshape(-1)
-
-        else:
-            # numpy.packbits encodes as msb (most significant bit); already in the right order
-            out = boolmask
-
-        return cls.numpy.packbits(out)
+            out = cls.numpy.take(_reversebits, out)
+        return out
 
     def boolmask(self, maskedwhen=None):
         if maskedwhen is None:
@@ -629,12 +641,11 @@ class BitMaskedArray(MaskedArray):
 
             elif len(where.shape) == 1 and issubclass(where.dtype.type, (self.numpy.bool, self.numpy.bool_)):
                 # scales with the size of the mask anyway, so go ahead and unpack the whole mask
-                unpacked = self.numpy.unpackbits(self._mask).view(self.MASKTYPE)
-
                 if self._lsborder:
-                    unpacked = unpacked.reshape(-1, 8)[:,::-1].reshape(-1)[:len(where)]
+                    unpacked = _lsbunpackbits(self.numpy, self._mask)
                 else:
-                    unpacked = unpacked[:len(where)]
+                    unpacked = self.numpy.unpackbits(self._mask)
+                unpacked = unpacked.view(self.MASKTYPE)[:len(where)]
 
                 return unpacked[where]
 
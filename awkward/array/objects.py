@@ -426,16 +426,13 @@ class StringArray(StringMethods, ObjectArray):
     @classmethod
     def fromiter(cls, iterable, encoding="utf-8"):
         if encoding is None:
-            encoded = iterable
+            encoded = list(iterable)
         else:
             encoder = codecs.getencoder(encoding)
             encoded = [encoder(x)[0] for x in iterable]
         counts = [len(x) for x in encoded]
-        content = cls.numpy.empty(sum(counts), dtype=cls.CHARTYPE)
-        i = 0
-        for x in encoded:
-            content[i : i + len(x)] = cls.numpy.frombuffer(x, dtype=cls.CHARTYPE)
-            i += len(x)
+        # one join into a (writable) bytearray instead of a frombuffer and slice assignment per string
+        content = cls.numpy.frombuffer(bytearray().join(encoded), dtype=cls.CHARTYPE)
         return cls.fromcounts(counts, content, encoding)
 
     @classmethod
@@ -590,6 +587,9 @@ class StringArray(StringMethods, ObjectArray):
         self._encoding = value
         self._args = (decodefcn,)
 
+    def _asciicompatible(self):
+        return self._encoding is not None and codecs.lookup(self._encoding).name in ("utf-8", "ascii")
+
     @property
     def offsets(self):
         return self._content.offsets
@@ -612,6 +612,37 @@ class StringArray(StringMethods, ObjectArray):
         else:
             return str
 
+    def __iter__(self, checkiter=True):
+        if checkiter:
+            self._checkiter()
+        self._valid()
+        starts, stops, content = self._content._starts, self._content._stops, self._content._content
+        dense = False
+        if self._generator is tostring and len(starts.shape) == 1 and isinstance(content, self.numpy.ndarray) and len(starts) > 0:
+            offset = starts.min()
+            # a sparse selection (e.g. a few strings of a large array) would copy far more than it yields
+            dense = stops.max() - offset <= 2 * (stops - starts).sum()
+
+        if not dense:
+            for x in super(StringArray, self).__iter__(checkiter=False):
+                yield x
+        else:
+            # one bytes object sliced per string, rather than an ndarray view (and tostring) per string
+            data = content[offset:stops.max()].tobytes()
+            starts, stops = starts - offset, stops - offset
+            decoder = self._args[0]
+            if decoder is None:
+                for start, stop in zip(starts.tolist(), stops.tolist()):
+                    yield data[start:stop]
+            elif self._asciicompatible() and (len(data) == 0 or self.numpy.frombuffer(data, dtype=self.numpy.uint8).max() < 128):
+                # pure ASCII: byte offsets are character offsets, so decode once and slice the str
+                text = data.decode("ascii")
+                for start, stop in zip(starts.tolist(), stops.tolist()):
+                    yield text[start:stop]
+            else:
+                for start, stop in zip(starts.tolist(), stops.tolist()):
+                    yield decoder(data[start:stop], errors="replace")[0]
+
     def __getitem__(self, where):
         if self._util_isstringslice(where):
             raise IndexError("cannot index StringArray with string or sequence of strings")
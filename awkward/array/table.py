@@ -80,7 +80,7 @@ class Table(awkward.array.base.AwkwardArray):
                 except KeyError:
                     raise ValueError("no column named {0}".format(repr(where)))
 
-            elif self._util_isstringslice(where):
+            elif self._table._util_isstringslice(where):
                 contents = OrderedDict()
                 for n in where:
                     try:
@@ -241,7 +241,24 @@ class Table(awkward.array.base.AwkwardArray):
             self[n] = x
 
     def tolist(self):
-        return list(x.tolist() for x in self)
+        if len(self._contents) == 0:
+            return list(x.tolist() for x in self)
+
+        # convert each column once and zip them into rows, rather than building every row through Row
+        index = self._index()
+        columns = []
+        for x in self._contents.values():
+            x = x[index]
+            if isinstance(x, self.numpy.ndarray) and x.dtype == self.numpy.dtype(object):
+                # elements of object arrays (e.g. ndarrays) are converted one by one, as Row.tolist does
+                columns.append([self._try_tolist(y) for y in x])
+            else:
+                columns.append(self._try_tolist(x))
+        if self.istuple:
+            return list(zip(*columns))
+        else:
+            names = list(self._contents)
+            return [dict(zip(names, row)) for row in zip(*columns)]
 
     @classmethod
     def named(cls, rowname, columns1={}, *columns2, **columns3):
@@ -605,7 +622,10 @@ class Table(awkward.array.base.AwkwardArray):
                         contents[n] = self._contents[n]
                     except KeyError:
                         raise ValueError("no column named {0}".format(repr(n)))
-                return self.copy(contents=contents)
+                # same view, same column arrays: only the (already fresh) mapping differs, so don't copy it again
+                out = self.copy(contents={})
+                out._contents = contents
+                return out
 
         if isinstance(where, tuple) and where == ():
             return self
@@ -2,6 +2,9 @@
 
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-array/blob/master/LICENSE
 
+import functools
+import operator
+
 import awkward.array.base
 import awkward.type
 import awkward.util
@@ -69,7 +72,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
         self._valid()
         for tag in self.numpy.unique(self._tags):
             mask = self._tags == tag
-            if not self.numpy.array_equal(self._index[mask], self.numpy.arange(self.numpy.count_nonzero(mask))):
+            if not self.numpy.array_equal(self.index[mask], self.numpy.arange(self.numpy.count_nonzero(mask))):
                 return False
         return True
 
@@ -89,7 +92,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
             return serializer.encode_call(
                 ["awkward", "UnionArray"],
                 serializer(self._tags, "UnionArray.tags"),
-                serializer(self._index, "UnionArray.index"),
+                serializer(self.index, "UnionArray.index"),
                 {"list": [
                     serializer(x, "UnionArray.contents")
                     for x in self._contents
@@ -129,10 +132,17 @@ class UnionArray(awkward.array.base.AwkwardArray):
 
     @property
     def index(self):
+        if self._index is None:
+            # identity index (e.g. from a sparse union), only materialized when needed
+            self._index = self.numpy.arange(len(self._tags), dtype=self.INDEXTYPE).reshape(self._tags.shape)
         return self._index
 
     @index.setter
     def index(self, value):
+        if value is None:
+            self._index = None
+            self._isvalid = False
+            return
         value = self._util_toarray(value, self.INDEXTYPE, self.numpy.ndarray)
         if self.check_prop_valid:
             if not self._util_isintegertype(value.dtype.type):
@@ -246,7 +256,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
 
     def _util_layout(self, position, seen, lookup):
         awkward.type.LayoutNode(self._tags, position + (0,), seen, lookup)
-        awkward.type.LayoutNode(self._index, position + (1,), seen, lookup)
+        awkward.type.LayoutNode(self.index, position + (1,), seen, lookup)
         positions = []
         for i, x in enumerate(self._contents):
             awkward.type.LayoutNode(x, position + (2 + i,), seen, lookup)
@@ -258,23 +268,31 @@ class UnionArray(awkward.array.base.AwkwardArray):
     def _valid(self):
         if self.check_whole_valid:
             if not self._isvalid:
-                if len(self._tags.shape) > len(self._index.shape):
-                    raise ValueError("tags length ({0}) must be less than or equal to index length ({1})".format(len(self._tags.shape), len(self._index.shape)))
+                if len(self._tags.shape) > len(self.index.shape):
+                    raise ValueError("tags length ({0}) must be less than or equal to index length ({1})".format(len(self._tags.shape), len(self.index.shape)))
 
-                if self._tags.shape[1:] != self._index.shape[1:]:
-                    raise ValueError("tags dimensionality ({0}) must be equal to index dimensionality ({1})".format(self._tags.shape[1:], self._index.shape[1:]))
+                if self._tags.shape[1:] != self.index.shape[1:]:
+                    raise ValueError("tags dimensionality ({0}) must be equal to index dimensionality ({1})".format(self._tags.shape[1:], self.index.shape[1:]))
 
                 if len(self._tags.reshape(-1)) > 0 and self._tags.reshape(-1).max() >= len(self._contents):
                     raise ValueError("maximum tag is {0} but there are only {1} contents arrays".format(self._tags.reshape(-1).max(), len(self._contents)))
 
-                index = self._index[:len(self._tags)]
-                for tag in self.numpy.unique(self._tags):
+                index = self.index[:len(self._tags)]
+                for tag in self._presenttags(self._tags, len(self._contents)):
                     maxindex = index[self._tags == tag].reshape(-1).max()
                     if maxindex >= len(self._contents[tag]):
                         raise ValueError("maximum index ({0}) must be less than the length of all contents arrays ({1})".format(maxindex, len(self._contents[tag])))
 
                 self._isvalid = True
 
+    def _presenttags(self, tags, numtags):
+        # the distinct values of non-negative integers below numtags, in order; counting them is faster than sorting
+        tags = tags.reshape(-1)
+        if numtags <= max(len(tags), 65536) and tags.dtype != self.numpy.uint64:
+            return self.numpy.nonzero(self.numpy.bincount(tags, minlength=numtags))[0]
+        else:
+            return self.numpy.unique(tags)
+
     def __iter__(self, checkiter=True):
         if checkiter:
             self._checkiter()
@@ -282,7 +300,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
 
         tags = self._tags
         lentags = len(self._tags)
-        index = self._index
+        index = self.index
         contents = self._contents
 
         i = 0
@@ -310,7 +328,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
         head, tail = where[:len(self._tags.shape)], where[len(self._tags.shape):]
 
         tags = self._tags[head]
-        index = self._index[:len(self._tags)][head]
+        index = self.index[:len(self._tags)][head]
 
         if len(tags.shape) == len(index.shape) == 0:
             return self._contents[tags][(index,) + tail]
@@ -328,7 +346,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
 
         if isinstance(where, awkward.util.string):
             for tag in self.numpy.unique(self._tags):
-                inverseindex = self.IndexedArray.invert(self._index[:len(self._tags)][self._tags == tag])
+                inverseindex = self.IndexedArray.invert(self.index[:len(self._tags)][self._tags == tag])
                 self._contents[tag][where] = self.IndexedArray(inverseindex, what)
 
         elif self._util_isstringslice(where):
@@ -336,7 +354,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
             if len(where) != len(what):
                 raise ValueError("number of keys ({0}) does not match number of provided arrays ({1})".format(len(where), len(what)))
             for tag in self.numpy.unique(self._tags):
-                inverseindex = self.IndexedArray.invert(self._index[:len(self._tags)][self._tags == tag])
+                inverseindex = self.IndexedArray.invert(self.index[:len(self._tags)][self._tags == tag])
                 for x, y in zip(where, what):
                     self._contents[tag][x] = self.IndexedArray(inverseindex, y)
 
@@ -373,7 +391,12 @@ class UnionArray(awkward.array.base.AwkwardArray):
         if any(x.shape != tags[0].shape for x in tags[1:]):
             raise ValueError("cannot {0} UnionArrays because tag shapes differ".format(ufunc))
 
-        combos = self.numpy.stack(tags, axis=-1).view([(str(i), x.dtype) for i, x in enumerate(tags)]).reshape(tags[0].shape)
+        # each combination of tags as one mixed-radix integer, which sorts the same way as the combinations
+        numcontents = [len(x._contents) for x in inputs if isinstance(x, UnionArray)]
+        combos = tags[0].astype(self.INDEXTYPE)
+        for x, n in zip(tags[1:], numcontents[1:]):
+            combos *= n
+            combos += x
 
         outtags = self.numpy.empty(tags[0].shape, dtype=self.TAGTYPE)
         outindex = self.numpy.empty(tags[0].shape, dtype=self.INDEXTYPE)
@@ -381,7 +404,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
         out = None
         contents = {}
         types = {}
-        for outtag, combo in enumerate(self.numpy.unique(combos)):
+        for outtag, combo in enumerate(self._presenttags(combos, functools.reduce(operator.mul, numcontents))):
             mask = (combos == combo)
             outtags[mask] = outtag
             outindex[mask] = self.numpy.arange(self.numpy.count_nonzero(mask))
@@ -426,7 +449,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
         out = self.numpy.empty(len(self), self.uniondtype(arrays))
         for tag, array in enumerate(arrays):
             mask = (self._tags == tag)
-            out[mask] = array[self._index[mask]]
+            out[mask] = array[self.index[mask]]
         return out
 
     def boolmask(self, maskedwhen=True):
@@ -435,7 +458,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
         out = self.numpy.empty(len(self), self.MASKTYPE)
         for tag, array in enumerate(arrays):
             mask = (self._tags == tag)
-            out[mask] = array[self._index[mask]]
+            out[mask] = array[self.index[mask]]
         return out
 
     def choose(self, n):
@@ -478,7 +501,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
         out = self.numpy.empty(len(self), self.uniondtype(arrays))
         for tag, array in enumerate(arrays):
             mask = (self._tags == tag)
-            out[mask] = array[self._index[mask]]
+            out[mask] = array[self.index[mask]]
         return out
 
     def _hasjagged(self):
@@ -507,7 +530,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
             dtype = self.dtype
 
         out = None
-        index = self._index[:len(self._tags)]
+        index = self.index[:len(self._tags)]
         for tag, content in enumerate(self._contents):
             if not isinstance(content, self.numpy.ndarray):
                 content = content._prepare(ufunc, identity, dtype)
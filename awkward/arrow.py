@@ -4,6 +4,7 @@
 
 import codecs
 import json
+import threading
 
 import numpy
 
@@ -18,181 +19,270 @@ import awkward.array.virtual
 import awkward.type
 import awkward.util
 
+# pyarrow is imported inside each function, not here: it is optional, and awkward/__init__.py imports this
+# module, so a module-level import would add pyarrow's (and pyarrow.parquet's) load time to every "import awkward";
+# once loaded, a function-level import is only a sys.modules lookup
+
 ################################################################################ type conversions
 
-def schema2type(schema):
+def _schema2type(tpe, nullable):
     import pyarrow
 
-    def recurse(tpe, nullable):
-        if isinstance(tpe, pyarrow.lib.DictionaryType):
-            out = recurse(tpe.dictionary.type, nullable)
-            if nullable:
-                return awkward.type.OptionType(out)
+    if isinstance(tpe, pyarrow.lib.DictionaryType):
+        out = _schema2type(tpe.dictionary.type, nullable)
+        if nullable:
+            return awkward.type.OptionType(out)
+        else:
+            return out
+
+    elif isinstance(tpe, pyarrow.lib.StructType):
+        out = None
+        for i in range(tpe.num_children):
+            x = awkward.type.ArrayType(tpe[i].name, _schema2type(tpe[i].type, tpe[i].nullable))
+            if out is None:
+                out = x
             else:
-                return out
+                out = out & x
+        if nullable:
+            return awkward.type.OptionType(out)
+        else:
+            return out
 
-        elif isinstance(tpe, pyarrow.lib.StructType):
-            out = None
-            for i in range(tpe.num_children):
-                x = awkward.type.ArrayType(tpe[i].name, recurse(tpe[i].type, tpe[i].nullable))
-                if out is None:
-                    out = x
-                else:
-                    out = out & x
-            if nullable:
-                return awkward.type.OptionType(out)
+    elif isinstance(tpe, pyarrow.lib.ListType):
+        out = awkward.type.ArrayType(float("inf"), _schema2type(tpe.value_type, nullable))
+        if nullable:
+            return awkward.type.OptionType(out)
+        else:
+            return out
+
+    elif isinstance(tpe, pyarrow.lib.UnionType):
+        out = None
+        for i in range(tpe.num_children):
+            x = _schema2type(tpe[i].type, nullable)
+            if out is None:
+                out = x
             else:
-                return out
+                out = out | x
+        if nullable:
+            return awkward.type.OptionType(out)
+        else:
+            return out
 
-        elif isinstance(tpe, pyarrow.lib.ListType):
-            out = awkward.type.ArrayType(float("inf"), recurse(tpe.value_type, nullable))
-            if nullable:
-                return awkward.type.OptionType(out)
-            else:
-                return out
+    elif tpe == pyarrow.string():
+        if nullable:
+            return awkward.type.OptionType(str)
+        else:
+            return str
 
-        elif isinstance(tpe, pyarrow.lib.UnionType):
-            out = None
-            for i in range(tpe.num_children):
-                x = recurse(tpe[i].type, nullable)
-                if out is None:
-                    out = x
-                else:
-                    out = out | x
-            if nullable:
-                return awkward.type.OptionType(out)
-            else:
-                return out
+    elif tpe == pyarrow.binary():
+        if nullable:
+            return awkward.type.OptionType(bytes)
+        else:
+            return bytes
 
-        elif tpe == pyarrow.string():
-            if nullable:
-                return awkward.type.OptionType(str)
-            else:
-                return str
+    elif tpe == pyarrow.bool_():
+        out = awkward.numpy.dtype(bool)
+        if nullable:
+            return awkward.type.OptionType(out)
+        else:
+            return out
 
-        elif tpe == pyarrow.binary():
-            if nullable:
-                return awkward.type.OptionType(bytes)
-            else:
-                return bytes
+    elif isinstance(tpe, pyarrow.lib.DataType):
+        if nullable:
+            return awkward.type.OptionType(tpe.to_pandas_dtype())
+        else:
+            return tpe.to_pandas_dtype()
 
-        elif tpe == pyarrow.bool_():
-            out = awkward.numpy.dtype(bool)
-            if nullable:
-                return awkward.type.OptionType(out)
-            else:
-                return out
+    else:
+        raise NotImplementedError(repr(tpe))
 
-        elif isinstance(tpe, pyarrow.lib.DataType):
-            if nullable:
-                return awkward.type.OptionType(tpe.to_pandas_dtype())
-            else:
-                return tpe.to_pandas_dtype()
+# schema2type results by schema fields; parquet files with many row groups or many workers repeat the same schema
+_schema2type_cache = {}
+_schema2type_cachesize = 100
 
-        else:
-            raise NotImplementedError(repr(tpe))
+def schema2type(schema):
+    try:
+        key = tuple((field.name, field.type, field.nullable) for field in schema)
+        return _schema2type_cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        key = None    # some Arrow types are unhashable
 
     out = None
     for name in schema.names:
         field = schema.field_by_name(name)
-        mytype = awkward.type.ArrayType(name, recurse(field.type, field.nullable))
+        mytype = awkward.type.ArrayType(name, _schema2type(field.type, field.nullable))
         if out is None:
             out = mytype
         else:
             out = out & mytype
 
+    if key is not None:
+        if len(_schema2type_cache) >= _schema2type_cachesize:
+            _schema2type_cache.clear()
+        _schema2type_cache[key] = out
     return out
 
 ################################################################################ value conversions
 
-def toarrow(obj):
+# Arrow bitmaps are LSB-first
+_lsbunpackbits = awkward.array.masked._lsbunpackbits
+
+def _toarrow_numpy(obj, mask, dictencode):
     import pyarrow
+    if len(obj.shape) == 1 and obj.dtype.kind in "iuf" and obj.dtype.isnative and obj.flags.c_contiguous:
+        # zero-copy: Arrow's data buffer for a primitive type is the Numpy array itself
+        if mask is None:
+            validity = None
+        else:
+            # Arrow's validity bitmap is packed LSB-first, not one byte per entry
+            validity = pyarrow.py_buffer(awkward.array.masked.BitMaskedArray.bool2bit(numpy.logical_not(mask), lsborder=True))
+        return pyarrow.Array.from_buffers(pyarrow.from_numpy_dtype(obj.dtype), len(obj), [validity, pyarrow.py_buffer(obj)])
+    else:
+        return pyarrow.array(obj, mask=mask)
+
+def _toarrow_chunked(obj, mask, dictencode):
+    raise TypeError("only top-level ChunkedArrays can be converted to Arrow (as RecordBatches)")
 
-    def recurse(obj, mask):
-        if isinstance(obj, numpy.ndarray):
-            return pyarrow.array(obj, mask=mask)
+def _toarrow_indexed(obj, mask, dictencode):
+    import pyarrow
+    if mask is None:
+        return pyarrow.DictionaryArray.from_arrays(obj.index, _toarrow(obj.content, mask, dictencode))
+    else:
+        return _toarrow(obj.content[obj.index], mask, dictencode)
 
-        elif isinstance(obj, awkward.array.chunked.ChunkedArray):   # includes AppendableArray
-            raise TypeError("only top-level ChunkedArrays can be converted to Arrow (as RecordBatches)")
+def _toarrow_sparse(obj, mask, dictencode):
+    return _toarrow(obj.dense, mask, dictencode)
 
-        elif isinstance(obj, awkward.array.indexed.IndexedArray):
-            if mask is None:
-                return pyarrow.DictionaryArray.from_arrays(obj.index, recurse(obj.content, mask))
-            else:
-                return recurse(obj.content[obj.index], mask)
-
-        elif isinstance(obj, awkward.array.indexed.SparseArray):
-            return recurse(obj.dense, mask)
-
-        elif isinstance(obj, awkward.array.jagged.JaggedArray):
-            obj = obj.compact()
-            if mask is not None:
-                mask = obj.tojagged(mask).flatten()
-            return pyarrow.ListArray.from_arrays(obj.offsets, recurse(obj.content, mask))
-
-        elif isinstance(obj, awkward.array.masked.IndexedMaskedArray):
-            thismask = obj.boolmask(maskedwhen=True)
-            if mask is not None:
-                thismask = mask | thismask
-            if len(obj.content) == 0:
-                content = obj.numpy.empty(len(obj.mask), dtype=obj.DEFAULTTYPE)
-            else:
-                content = obj.content[obj.mask]
-            return recurse(content, thismask)
-
-        elif isinstance(obj, awkward.array.masked.MaskedArray):   # includes BitMaskedArray
-            thismask = obj.boolmask(maskedwhen=True)
-            if mask is not None:
-                thismask = mask | thismask
-            return recurse(obj.content, thismask)
-
-        elif isinstance(obj, awkward.array.objects.StringArray):
-            # # FIXME: BinaryArray.from_buffers is not implemented in pyarrow yet.
-            # if obj.encoding is None:
-            #     convert = lambda length, offsets, content: pyarrow.BinaryArray.from_buffers(pyarrow.binary(), length, [None, offsets, content])
-            # elif codecs.lookup(obj.encoding) is codecs.lookup("utf-8"):
-            #     convert = lambda length, offsets, content: pyarrow.StringArray.from_buffers(length, offsets, content)
-            # else:
-            #     raise ValueError("only encoding=None or encoding='utf-8' can be converted to Arrow")
-            convert = lambda length, offsets, content: pyarrow.StringArray.from_buffers(length, offsets, content)
-
-            obj = obj.compact()
-            offsets = obj.offsets
-            if offsets.dtype != numpy.dtype(numpy.int32):
-                offsets = offsets.astype(numpy.int32)
-
-            return convert(len(offsets) - 1, pyarrow.py_buffer(offsets), pyarrow.py_buffer(obj.content))
-
-        elif isinstance(obj, awkward.array.objects.ObjectArray):
-            # throw away Python object interpretation, which Arrow can't handle while being multilingual
-            return recurse(obj.content, mask)
-
-        elif isinstance(obj, awkward.array.table.Table):
-            return pyarrow.StructArray.from_arrays([recurse(x, mask) for x in obj.contents.values()], list(obj.contents))
-
-        elif isinstance(obj, awkward.array.union.UnionArray):
-            contents = []
-            for i, x in enumerate(obj.contents):
-                if mask is None:
-                    thismask = None
-                else:
-                    thistags = (obj.tags == i)
-                    thismask = obj.numpy.empty(len(x), dtype=obj.MASKTYPE)
-                    thismask[obj.index[thistags]] = mask[thistags]    # hmm... obj.index could have repeats; the Arrow mask in that case would not be well-defined...
-                contents.append(recurse(x, thismask))
+def _toarrow_jagged(obj, mask, dictencode):
+    import pyarrow
+    obj = obj.compact()
+    if mask is not None:
+        # same as obj.tojagged(mask).flatten(), without building parents
+        mask = obj.numpy.repeat(mask, awkward.util.windows_safe(obj.counts))
+    return pyarrow.ListArray.from_arrays(obj.offsets, _toarrow(obj.content, mask, dictencode))
 
-            return pyarrow.UnionArray.from_dense(pyarrow.array(obj.tags.astype(numpy.int8)), pyarrow.array(obj.index.astype(numpy.int32)), contents)
+def _toarrow_indexedmasked(obj, mask, dictencode):
+    import pyarrow
+    thismask = obj.boolmask(maskedwhen=True)    # always a new array for IndexedMaskedArray
+    if mask is not None:
+        obj.numpy.logical_or(mask, thismask, out=thismask)
+    if dictencode and len(obj.content) > 0:
+        # reference the content through the mask as dictionary indices, rather than gathering it
+        index = obj.numpy.where(thismask, 0, obj.mask).astype(numpy.int32)
+        return pyarrow.DictionaryArray.from_arrays(index, _toarrow(obj.content, None, dictencode), mask=thismask)
+    elif len(obj.content) == 0:
+        content = obj.numpy.empty(len(obj.mask), dtype=obj.DEFAULTTYPE)
+    else:
+        content = obj.content[obj.mask]
+    return _toarrow(content, thismask, dictencode)
+
+def _toarrow_masked(obj, mask, dictencode):
+    thismask = obj.boolmask(maskedwhen=True)
+    if mask is not None:
+        if thismask is obj.mask:
+            # MaskedArray.boolmask can return the array's own mask: don't overwrite it
+            thismask = mask | thismask
+        else:
+            obj.numpy.logical_or(mask, thismask, out=thismask)
+    return _toarrow(obj.content, thismask, dictencode)
 
-        elif isinstance(obj, awkward.array.virtual.VirtualArray):
-            return recurse(obj.array, mask)
+def _toarrow_string(obj, mask, dictencode):
+    import pyarrow
+    # # FIXME: BinaryArray.from_buffers is not implemented in pyarrow yet.
+    # if obj.encoding is None:
+    #     convert = lambda length, offsets, content: pyarrow.BinaryArray.from_buffers(pyarrow.binary(), length, [None, offsets, content])
+    # elif codecs.lookup(obj.encoding) is codecs.lookup("utf-8"):
+    #     convert = lambda length, offsets, content: pyarrow.StringArray.from_buffers(length, offsets, content)
+    # else:
+    #     raise ValueError("only encoding=None or encoding='utf-8' can be converted to Arrow")
+    convert = lambda length, offsets, content: pyarrow.StringArray.from_buffers(length, offsets, content)
+
+    obj = obj.compact()
+    offsets = obj.offsets
+    if offsets.dtype != numpy.dtype(numpy.int32):
+        offsets = offsets.astype(numpy.int32)
+
+    return convert(len(offsets) - 1, pyarrow.py_buffer(offsets), pyarrow.py_buffer(obj.content))
+
+def _toarrow_object(obj, mask, dictencode):
+    # throw away Python object interpretation, which Arrow can't handle while being multilingual
+    return _toarrow(obj.content, mask, dictencode)
+
+def _toarrow_columns(obj, mask, dictencode):
+    # arrays and names in one pass over the Table's contents
+    arrays, names = [], []
+    for n, x in obj.contents.items():
+        arrays.append(_toarrow(x, mask, dictencode))
+        names.append(n)
+    return arrays, names
+
+def _toarrow_table(obj, mask, dictencode):
+    import pyarrow
+    return pyarrow.StructArray.from_arrays(*_toarrow_columns(obj, mask, dictencode))
 
+def _toarrow_union(obj, mask, dictencode):
+    import pyarrow
+    if mask is not None:
+        # group positions by tag with one stable sort, rather than one pass over the tags per content
+        order = obj.numpy.argsort(obj.tags, kind="mergesort")
+        boundaries = obj.numpy.searchsorted(obj.tags[order], obj.numpy.arange(len(obj.contents) + 1))
+        index = obj.index
+
+    contents = []
+    for i, x in enumerate(obj.contents):
+        if mask is None:
+            thismask = None
+        else:
+            these = order[boundaries[i]:boundaries[i + 1]]
+            thismask = obj.numpy.empty(len(x), dtype=obj.MASKTYPE)
+            thismask[index[these]] = mask[these]    # hmm... obj.index could have repeats; the Arrow mask in that case would not be well-defined...
+        contents.append(_toarrow(x, thismask, dictencode))
+
+    return pyarrow.UnionArray.from_dense(pyarrow.array(obj.tags.astype(numpy.int8)), pyarrow.array(obj.index.astype(numpy.int32)), contents)
+
+def _toarrow_virtual(obj, mask, dictencode):
+    return _toarrow(obj.array, mask, dictencode)
+
+# order matters: the first superclass that matches wins, as in an isinstance chain
+_toarrow_handlers = [
+    (numpy.ndarray,                            _toarrow_numpy),
+    (awkward.array.chunked.ChunkedArray,       _toarrow_chunked),         # includes AppendableArray
+    (awkward.array.indexed.IndexedArray,       _toarrow_indexed),
+    (awkward.array.indexed.SparseArray,        _toarrow_sparse),
+    (awkward.array.jagged.JaggedArray,         _toarrow_jagged),
+    (awkward.array.masked.IndexedMaskedArray,  _toarrow_indexedmasked),
+    (awkward.array.masked.MaskedArray,         _toarrow_masked),          # includes BitMaskedArray
+    (awkward.array.objects.StringArray,        _toarrow_string),
+    (awkward.array.objects.ObjectArray,        _toarrow_object),
+    (awkward.array.table.Table,                _toarrow_table),
+    (awkward.array.union.UnionArray,           _toarrow_union),
+    (awkward.array.virtual.VirtualArray,       _toarrow_virtual),
+    ]
+
+# resolved handlers by exact class, filled as new classes (including mixins) are seen
+_toarrow_bytype = {}
+
+def _toarrow(obj, mask, dictencode):
+    cls = type(obj)
+    handler = _toarrow_bytype.get(cls)
+    if handler is None:
+        for supercls, handler in _toarrow_handlers:
+            if issubclass(cls, supercls):
+                break
         else:
-            raise TypeError("cannot convert type {0} to Arrow".format(type(obj)))
+            raise TypeError("cannot convert type {0} to Arrow".format(cls))
+        _toarrow_bytype[cls] = handler
+    return handler(obj, mask, dictencode)
+
+def toarrow(obj, dictencode=False):
+    import pyarrow
 
     if isinstance(obj, awkward.array.chunked.ChunkedArray):   # includes AppendableArray
         batches = []
         for chunk in obj.chunks:
-            arr = toarrow(chunk)
+            arr = toarrow(chunk, dictencode=dictencode)
             if isinstance(arr, pyarrow.Table):
                 batches.extend(arr.to_batches())
             else:
@@ -205,191 +295,214 @@ def toarrow(obj):
             content = obj.numpy.empty(len(obj.mask), dtype=obj.DEFAULTTYPE)
         else:
             content = obj.content[obj.mask]
-        return pyarrow.Table.from_batches([pyarrow.RecordBatch.from_arrays([recurse(x, mask) for x in obj.content.contents.values()], list(obj.content.contents))])
+        return pyarrow.Table.from_batches([pyarrow.RecordBatch.from_arrays(*_toarrow_columns(obj.content, mask, dictencode))])
 
     elif isinstance(obj, awkward.array.masked.MaskedArray) and isinstance(obj.content, awkward.array.table.Table):   # includes BitMaskedArray
         mask = obj.boolmask(maskedwhen=True)
-        return pyarrow.Table.from_batches([pyarrow.RecordBatch.from_arrays([recurse(x, mask) for x in obj.content.contents.values()], list(obj.content.contents))])
+        return pyarrow.Table.from_batches([pyarrow.RecordBatch.from_arrays(*_toarrow_columns(obj.content, mask, dictencode))])
 
     elif isinstance(obj, awkward.array.table.Table):
-        return pyarrow.Table.from_batches([pyarrow.RecordBatch.from_arrays([recurse(x, None) for x in obj.contents.values()], list(obj.contents))])
+        return pyarrow.Table.from_batches([pyarrow.RecordBatch.from_arrays(*_toarrow_columns(obj, None, dictencode))])
 
     else:
-        return recurse(obj, None)
+        return _toarrow(obj, None, dictencode)
 
-def fromarrow(obj, awkwardlib=None):
-    import pyarrow
-    awkwardlib = awkward.util.awkwardlib(awkwardlib)
-    ARROW_BITMASKTYPE = awkwardlib.numpy.uint8
-    ARROW_INDEXTYPE = awkwardlib.numpy.int32
-    ARROW_TAGTYPE = awkwardlib.numpy.uint8
-    ARROW_CHARTYPE = awkwardlib.numpy.uint8
-
-    def popbuffers(array, tpe, buffers, length):
-        if isinstance(tpe, pyarrow.lib.DictionaryType):
-            index = popbuffers(None if array is None else array.indices, tpe.index_type, buffers, length)
-            if hasattr(tpe, "dictionary"):
-                content = fromarrow(tpe.dictionary)
-            elif array is not None:
-                content = fromarrow(array.dictionary)
-            else:
-                raise NotImplementedError("no way to access Arrow dictionary inside of UnionArray")
-            if isinstance(index, awkwardlib.BitMaskedArray):
-                return awkwardlib.BitMaskedArray(index.mask, awkwardlib.IndexedArray(index.content, content), maskedwhen=index.maskedwhen, lsborder=index.lsborder)
-            else:
-                return awkwardlib.IndexedArray(index, content)
-
-        elif isinstance(tpe, pyarrow.lib.StructType):
-            assert getattr(tpe, "num_buffers", 1) == 1
-            mask = buffers.pop(0)
-            pairs = []
-            for i in range(tpe.num_children):
-                pairs.append((tpe[i].name, popbuffers(None if array is None else array.field(tpe[i].name), tpe[i].type, buffers, length)))
-            out = awkwardlib.Table.frompairs(pairs, 0)   # FIXME: better rowstart
-            if mask is not None:
-                mask = awkwardlib.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkwardlib.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
-
-        elif isinstance(tpe, pyarrow.lib.ListType):
-            assert getattr(tpe, "num_buffers", 2) == 2
-            mask = buffers.pop(0)
-            offsets = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_INDEXTYPE)[:length + 1]
-            content = popbuffers(None if array is None else array.flatten(), tpe.value_type, buffers, offsets[-1])
-            out = awkwardlib.JaggedArray.fromoffsets(offsets, content)
-            if mask is not None:
-                mask = awkwardlib.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkwardlib.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
-
-        elif isinstance(tpe, pyarrow.lib.UnionType) and tpe.mode == "sparse":
-            assert getattr(tpe, "num_buffers", 3) == 3
-            mask = buffers.pop(0)
-            tags = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_TAGTYPE)[:length]
-            assert buffers.pop(0) is None
-            index = awkwardlib.numpy.arange(len(tags), dtype=ARROW_INDEXTYPE)
-            contents = []
-            for i in range(tpe.num_children):
-                try:
-                    sublength = index[tags == i][-1] + 1
-                except IndexError:
-                    sublength = 0
-                contents.append(popbuffers(None, tpe[i].type, buffers, sublength))
-            for i in range(len(contents)):
-                these = index[tags == i]
-                if len(these) == 0:
-                    contents[i] = contents[i][0:0]
-                else:
-                    contents[i] = contents[i][: these[-1] + 1]
-            out = awkwardlib.UnionArray(tags, index, contents)
-            if mask is not None:
-                mask = awkwardlib.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkwardlib.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
-
-        elif isinstance(tpe, pyarrow.lib.UnionType) and tpe.mode == "dense":
-            assert getattr(tpe, "num_buffers", 3) == 3
-            mask = buffers.pop(0)
-            tags = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_TAGTYPE)[:length]
-            index = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_INDEXTYPE)[:length]
-            contents = []
-            for i in range(tpe.num_children):
-                try:
-                    sublength = index[tags == i].max() + 1
-                except ValueError:
-                    sublength = 0
-                contents.append(popbuffers(None, tpe[i].type, buffers, sublength))
-            for i in range(len(contents)):
-                these = index[tags == i]
-                if len(these) == 0:
-                    contents[i] = contents[i][0:0]
-                else:
-                    contents[i] = contents[i][: these.max() + 1]
-            out = awkwardlib.UnionArray(tags, index, contents)
-            if mask is not None:
-                mask = awkwardlib.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkwardlib.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
-
-        elif tpe == pyarrow.string():
-            assert getattr(tpe, "num_buffers", 3) == 3
-            mask = buffers.pop(0)
-            offsets = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_INDEXTYPE)[:length + 1]
-            content = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_CHARTYPE)[:offsets[-1]]
-            out = awkwardlib.StringArray.fromoffsets(offsets, content[:offsets[-1]], encoding="utf-8")
-            if mask is not None:
-                mask = awkwardlib.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkwardlib.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+ARROW_BITMASKTYPE = numpy.uint8
+ARROW_INDEXTYPE = numpy.int32
+ARROW_TAGTYPE = numpy.uint8
+ARROW_CHARTYPE = numpy.uint8
 
-        elif tpe == pyarrow.binary():
-            assert getattr(tpe, "num_buffers", 3) == 3
-            mask = buffers.pop(0)
-            offsets = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_INDEXTYPE)[:length + 1]
-            content = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_CHARTYPE)[:offsets[-1]]
-            out = awkwardlib.StringArray.fromoffsets(offsets, content[:offsets[-1]], encoding=None)
-            if mask is not None:
-                mask = awkwardlib.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkwardlib.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
+def _popbuffers_masked(awkwardlib, mask, out):
+    if mask is None:
+        return out
+    else:
+        return awkwardlib.BitMaskedArray(awkwardlib.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE), out, maskedwhen=False, lsborder=True)
+
+def _popbuffers_dictionary(awkwardlib, array, tpe, buffers, length):
+    index = _popbuffers(awkwardlib, None if array is None else array.indices, tpe.index_type, buffers, length)
+    if hasattr(tpe, "dictionary"):
+        content = fromarrow(tpe.dictionary)
+    elif array is not None:
+        content = fromarrow(array.dictionary)
+    else:
+        raise NotImplementedError("no way to access Arrow dictionary inside of UnionArray")
+    if isinstance(index, awkwardlib.BitMaskedArray):
+        return awkwardlib.BitMaskedArray(index.mask, awkwardlib.IndexedArray(index.content, content), maskedwhen=index.maskedwhen, lsborder=index.lsborder)
+    else:
+        return awkwardlib.IndexedArray(index, content)
+
+def _popbuffers_struct(awkwardlib, array, tpe, buffers, length):
+    assert getattr(tpe, "num_buffers", 1) == 1
+    mask = buffers.pop(0)
+    pairs = []
+    for i in range(tpe.num_children):
+        pairs.append((tpe[i].name, _popbuffers(awkwardlib, None if array is None else array.field(tpe[i].name), tpe[i].type, buffers, length)))
+    return _popbuffers_masked(awkwardlib, mask, awkwardlib.Table.frompairs(pairs, 0))   # FIXME: better rowstart
+
+def _popbuffers_list(awkwardlib, array, tpe, buffers, length):
+    assert getattr(tpe, "num_buffers", 2) == 2
+    mask = buffers.pop(0)
+    offsets = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_INDEXTYPE)[:length + 1]    # int32 offsets are used as they are, not copied
+    content = _popbuffers(awkwardlib, None if array is None else array.flatten(), tpe.value_type, buffers, offsets[-1])
+    return _popbuffers_masked(awkwardlib, mask, awkwardlib.JaggedArray.fromoffsets(offsets, content))
+
+def _popbuffers_union(awkwardlib, array, tpe, buffers, length):
+    if tpe.mode == "sparse":
+        assert getattr(tpe, "num_buffers", 3) == 3
+        mask = buffers.pop(0)
+        tags = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_TAGTYPE)[:length]
+        assert buffers.pop(0) is None
+        contents = []
+        for i in range(tpe.num_children):
+            these = awkwardlib.numpy.nonzero(tags == i)[0]
+            if len(these) == 0:
+                sublength = 0
             else:
-                return out
-
-        elif tpe == pyarrow.bool_():
-            assert getattr(tpe, "num_buffers", 2) == 2
-            mask = buffers.pop(0)
-            out = awkwardlib.numpy.unpackbits(awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_CHARTYPE)).view(awkwardlib.MaskedArray.BOOLTYPE)
-            out = out.reshape(-1, 8)[:,::-1].reshape(-1)[:length]    # lsborder=True
-            if mask is not None:
-                mask = awkwardlib.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkwardlib.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
+                sublength = these[-1] + 1
+            contents.append(_popbuffers(awkwardlib, None, tpe[i].type, buffers, sublength)[:sublength])
+        return _popbuffers_masked(awkwardlib, mask, awkwardlib.UnionArray(tags, None, contents))    # sparse: index is the identity, left unmaterialized
+
+    elif tpe.mode == "dense":
+        assert getattr(tpe, "num_buffers", 3) == 3
+        mask = buffers.pop(0)
+        tags = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_TAGTYPE)[:length]
+        index = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_INDEXTYPE)[:length]
+        contents = []
+        for i in range(tpe.num_children):
+            try:
+                sublength = index[tags == i].max() + 1
+            except ValueError:
+                sublength = 0
+            contents.append(_popbuffers(awkwardlib, None, tpe[i].type, buffers, sublength))
+        for i in range(len(contents)):
+            these = index[tags == i]
+            if len(these) == 0:
+                contents[i] = contents[i][0:0]
             else:
-                return out
+                contents[i] = contents[i][: these.max() + 1]
+        return _popbuffers_masked(awkwardlib, mask, awkwardlib.UnionArray(tags, index, contents))
 
-        elif isinstance(tpe, pyarrow.lib.DataType):
-            assert getattr(tpe, "num_buffers", 2) == 2
-            mask = buffers.pop(0)
-            out = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=tpe.to_pandas_dtype())[:length]
-            if mask is not None:
-                mask = awkwardlib.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkwardlib.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+    else:
+        raise NotImplementedError(repr(tpe))
+
+def _popbuffers_string(awkwardlib, array, tpe, buffers, length):
+    assert getattr(tpe, "num_buffers", 3) == 3
+    mask = buffers.pop(0)
+    offsets = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_INDEXTYPE)[:length + 1]
+    content = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_CHARTYPE)[:offsets[-1]]
+    return _popbuffers_masked(awkwardlib, mask, awkwardlib.StringArray.fromoffsets(offsets, content[:offsets[-1]], encoding="utf-8"))
+
+def _popbuffers_binary(awkwardlib, array, tpe, buffers, length):
+    assert getattr(tpe, "num_buffers", 3) == 3
+    mask = buffers.pop(0)
+    offsets = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_INDEXTYPE)[:length + 1]
+    content = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_CHARTYPE)[:offsets[-1]]
+    return _popbuffers_masked(awkwardlib, mask, awkwardlib.StringArray.fromoffsets(offsets, content[:offsets[-1]], encoding=None))
+
+def _popbuffers_bool(awkwardlib, array, tpe, buffers, length):
+    assert getattr(tpe, "num_buffers", 2) == 2
+    mask = buffers.pop(0)
+    bits = awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=ARROW_CHARTYPE)[:awkwardlib.BitMaskedArray._ceildiv8(length)]
+    out = _lsbunpackbits(awkwardlib.numpy, bits)    # lsborder=True, one pass
+    return _popbuffers_masked(awkwardlib, mask, out.view(awkwardlib.MaskedArray.BOOLTYPE)[:length])
+
+def _popbuffers_primitive(awkwardlib, array, tpe, buffers, length):
+    assert getattr(tpe, "num_buffers", 2) == 2
+    mask = buffers.pop(0)
+    return _popbuffers_masked(awkwardlib, mask, awkwardlib.numpy.frombuffer(buffers.pop(0), dtype=tpe.to_pandas_dtype())[:length])
+
+# filled on first use (pyarrow is an optional dependency); order matters, as in an isinstance chain
+_popbuffers_handlers = []
+
+# resolved handlers by exact Arrow type class and, for non-numeric primitives, by Arrow type id
+_popbuffers_bytype = {}
+_popbuffers_byid = {}
+
+def _popbuffers_resolve(tpe):
+    import pyarrow
+    if len(_popbuffers_handlers) == 0:
+        _popbuffers_handlers.extend([
+            (pyarrow.lib.DictionaryType, _popbuffers_dictionary),
+            (pyarrow.lib.StructType,     _popbuffers_struct),
+            (pyarrow.lib.ListType,       _popbuffers_list),
+            (pyarrow.lib.UnionType,      _popbuffers_union),
+            (pyarrow.lib.DataType,       _popbuffers_primitive),
+            ])
+        _popbuffers_byid[pyarrow.string().id] = _popbuffers_string
+        _popbuffers_byid[pyarrow.binary().id] = _popbuffers_binary
+        _popbuffers_byid[pyarrow.bool_().id] = _popbuffers_bool
+
+    for cls, handler in _popbuffers_handlers:
+        if isinstance(tpe, cls):
+            _popbuffers_bytype[type(tpe)] = handler
+            return handler
+    else:
+        raise NotImplementedError(repr(tpe))
+
+def _popbuffers(awkwardlib, array, tpe, buffers, length):
+    handler = _popbuffers_bytype.get(type(tpe))
+    if handler is None:
+        handler = _popbuffers_resolve(tpe)
+    if handler is _popbuffers_primitive:
+        handler = _popbuffers_byid.get(tpe.id, _popbuffers_primitive)
+    return handler(awkwardlib, array, tpe, buffers, length)
+
+# a decoder for one Arrow type, dispatching through _popbuffers
+def _popbuffers_fortype(tpe):
+    def popbuffers(awkwardlib, array, length):
+        buffers = array.buffers()
+        out = _popbuffers(awkwardlib, array, tpe, buffers, length)
+        assert len(buffers) == 0
+        return out
+    return popbuffers
 
-        else:
-            raise NotImplementedError(repr(tpe))
+def _popbuffers_array(awkwardlib, popbuffers, array):
+    # a sliced Array shares its parent's buffers: decode through the end of the slice, then drop the first array.offset items (a view)
+    out = popbuffers(awkwardlib, array, array.offset + len(array))
+    if array.offset != 0:
+        out = out[array.offset:]
+    return out
 
+def fromarrow(obj, awkwardlib=None, executor=None):
+    import pyarrow
+    awkwardlib = awkward.util.awkwardlib(awkwardlib)
     if isinstance(obj, pyarrow.lib.Array):
         buffers = obj.buffers()
-        out = popbuffers(obj, obj.type, buffers, len(obj))
+        out = _popbuffers(awkwardlib, obj, obj.type, buffers, obj.offset + len(obj))
         assert len(buffers) == 0
+        if obj.offset != 0:
+            out = out[obj.offset:]
         return out
 
     elif isinstance(obj, pyarrow.lib.ChunkedArray):
         chunks = [x for x in obj.chunks if len(x) > 0]
-        if len(chunks) == 1:
-            return chunks[0]
+        # every chunk has the same Arrow type: look up its decoder once, not per chunk
+        popbuffers = _popbuffers_fortype(obj.type)
+        contents = [_popbuffers_array(awkwardlib, popbuffers, x) for x in chunks]
+        if len(contents) == 1:
+            return contents[0]
         else:
-            return awkwardlib.ChunkedArray([fromarrow(x) for x in chunks], chunksizes=[len(x) for x in chunks])
+            return awkwardlib.ChunkedArray(contents, chunksizes=[len(x) for x in chunks])
 
     elif isinstance(obj, pyarrow.lib.RecordBatch):
+        # columns are independent; with an executor (e.g. concurrent.futures.ThreadPoolExecutor), decode them concurrently
+        if executor is None:
+            columns = [fromarrow(x) for x in obj.columns]
+        else:
+            columns = executor.map(fromarrow, obj.columns)
         out = awkwardlib.Table()
-        for n, x in zip(obj.schema.names, obj.columns):
-            out[n] = fromarrow(x)
+        for n, x in zip(obj.schema.names, columns):
+            out[n] = x
         return out
 
     elif isinstance(obj, pyarrow.lib.Table):
-        chunks = []
-        chunksizes = []
-        for batch in obj.to_batches():
-            chunk = fromarrow(batch)
-            if len(chunk) > 0:
-                chunks.append(chunk)
-                chunksizes.append(len(chunk))
+        # parallelize over batches, not also over their columns, so that no task waits on the same executor
+        batches = [x for x in obj.to_batches() if x.num_rows > 0]
+        if executor is None:
+            chunks = [fromarrow(x) for x in batches]
+        else:
+            chunks = list(executor.map(fromarrow, batches))
+        chunksizes = [x.num_rows for x in batches]
         if len(chunks) == 1:
             return chunks[0]
         else:
@@ -474,47 +587,131 @@ def toparquet(where, obj, **options):
             writer.close()
 
 class _ParquetFile(object):
-    def __init__(self, file, metadata=None, common_metadata=None):
+    def __init__(self, file, metadata=None, common_metadata=None, read_dictionary=None):
         self.file = file
         self.metadata = metadata
         self.common_metadata = common_metadata
+        self.read_dictionary = read_dictionary
         self._init()
 
     def _init(self):
         import pyarrow.parquet
-        self.parquetfile = pyarrow.parquet.ParquetFile(self.file, metadata=self.metadata, common_metadata=self.common_metadata)
+        options = {"metadata": self.metadata, "common_metadata": self.common_metadata}
+        if self.read_dictionary is not None:
+            # these columns stay dictionary-encoded and are read as IndexedArrays of their unique values
+            options["read_dictionary"] = self.read_dictionary
+        self._options = options
+        self.parquetfile = pyarrow.parquet.ParquetFile(self.file, **options)
         self.type = schema2type(self.parquetfile.schema.to_arrow_schema())
+        self._awkwardlib = awkward.util.awkwardlib(None)
+        self._lock = threading.Lock()
+        self._thread = threading.current_thread()
+        self._local = threading.local()
 
     def __getstate__(self):
-        return {"file": self.file, "metadata": self.metadata, "common_metadata": self.common_metadata}
+        return {"file": self.file, "metadata": self.metadata, "common_metadata": self.common_metadata, "read_dictionary": self.read_dictionary}
 
     def __setstate__(self, state):
         self.file = state["file"]
         self.metadata = state["metadata"]
         self.common_metadata = state["common_metadata"]
+        self.read_dictionary = state.get("read_dictionary")
         self._init()
 
+    def _readrowgroup(self, rowgroup, column):
+        # pyarrow does not promise that one ParquetFile can be read from several threads (ChunkedArray.prefetch):
+        # each thread opens its own reader of a named file, and a shared file object is read under the lock
+        if isinstance(self.file, awkward.util.string):
+            if threading.current_thread() is self._thread:
+                parquetfile = self.parquetfile
+            else:
+                parquetfile = getattr(self._local, "parquetfile", None)
+                if parquetfile is None:
+                    import pyarrow.parquet
+                    parquetfile = self._local.parquetfile = pyarrow.parquet.ParquetFile(self.file, **self._options)
+            return parquetfile.read_row_group(rowgroup, columns=[column])
+        else:
+            with self._lock:
+                return self.parquetfile.read_row_group(rowgroup, columns=[column])
+
     def __call__(self, rowgroup, column):
-        return fromarrow(self.parquetfile.read_row_group(rowgroup, columns=[column]))[column]
+        table = self._readrowgroup(rowgroup, column)
+        if table.num_columns == 1 and table.column(0).num_chunks == 1:
+            array = table.column(0).chunk(0)
+            return _popbuffers_array(self._awkwardlib, _popbuffers_fortype(array.type), array)
+        else:
+            return fromarrow(table)[column]
 
     def tojson(self):
-        json.dumps([self.file, self.metadata, self.common_metadata])
-        return {"file": self.file, "metadata": self.metadata, "common_metadata": self.common_metadata}
+        json.dumps([self.file, self.metadata, self.common_metadata, self.read_dictionary])
+        return {"file": self.file, "metadata": self.metadata, "common_metadata": self.common_metadata, "read_dictionary": self.read_dictionary}
 
     @classmethod
     def fromjson(cls, state):
-        return cls(state["file"], metadata=state["metadata"], common_metadata=state["common_metadata"])
+        return cls(state["file"], metadata=state["metadata"], common_metadata=state["common_metadata"], read_dictionary=state.get("read_dictionary"))
+
+def _rowgroupmaymatch(rowgroup, leafindex, filters):
+    # filters is a list of conjunctions of (column, op, value); a row group is skipped only if its
+    # min/max statistics rule out every conjunction
+    for conjunction in filters:
+        for column, op, value in conjunction:
+            if column not in leafindex:
+                raise ValueError("filter column {0} is not a non-nested column of this Parquet file".format(repr(column)))
+            statistics = rowgroup.column(leafindex[column]).statistics
+            if statistics is None or not statistics.has_min_max:
+                continue
+            low, high = statistics.min, statistics.max
+            try:
+                if op in ("=", "=="):
+                    excluded = value < low or value > high
+                elif op == "!=":
+                    excluded = low == high == value
+                elif op == "<":
+                    excluded = low >= value
+                elif op == "<=":
+                    excluded = low > value
+                elif op == ">":
+                    excluded = high <= value
+                elif op == ">=":
+                    excluded = high < value
+                elif op == "in":
+                    excluded = all(x < low or x > high for x in value)
+                elif op == "not in":
+                    excluded = False
+                else:
+                    raise ValueError("unrecognized filter operator {0}".format(repr(op)))
+            except TypeError:
+                excluded = False    # value not comparable with the statistics: can't tell
+            if excluded:
+                break
+        else:
+            return True
+    return False
 
-def fromparquet(file, awkwardlib=None, cache=None, persistvirtual=False, metadata=None, common_metadata=None):
+def fromparquet(file, awkwardlib=None, cache=None, persistvirtual=False, metadata=None, common_metadata=None, read_dictionary=None, columns=None, filters=None, prefetch=0, executor=None):
     awkwardlib = awkward.util.awkwardlib(awkwardlib)
-    parquetfile = _ParquetFile(file, metadata=metadata, common_metadata=common_metadata)
-    columns = parquetfile.type.columns
+    parquetfile = _ParquetFile(file, metadata=metadata, common_metadata=common_metadata, read_dictionary=read_dictionary)
+    allcolumns = parquetfile.type.columns
+    if columns is None or allcolumns == [""]:
+        columns = allcolumns
+    else:
+        columns = list(columns)
+        for n in columns:
+            if n not in allcolumns:
+                raise ValueError("column {0} is not in this Parquet file".format(repr(n)))
+
+    filemetadata = parquetfile.parquetfile.metadata
+    if filters is not None:
+        filters = list(filters)
+        if len(filters) > 0 and isinstance(filters[0], tuple):
+            filters = [filters]
+        leafindex = dict((filemetadata.schema.column(j).path, j) for j in range(filemetadata.num_columns))
 
     chunks = []
     chunksizes = []
     for i in range(parquetfile.parquetfile.num_row_groups):
-        numrows = parquetfile.parquetfile.metadata.row_group(i).num_rows
-        if numrows > 0:
+        numrows = filemetadata.row_group(i).num_rows
+        if numrows > 0 and (filters is None or _rowgroupmaymatch(filemetadata.row_group(i), leafindex, filters)):
             if columns == [""]:
                 chunk = awkwardlib.VirtualArray(parquetfile, (i, ""), cache=cache, type=awkwardlib.type.ArrayType(numrows, parquetfile.type[""]), persistvirtual=persistvirtual)
             else:
@@ -526,4 +723,8 @@ def fromparquet(file, awkwardlib=None, cache=None, persistvirtual=False, metadat
             chunks.append(chunk)
             chunksizes.append(numrows)
 
-    return awkwardlib.ChunkedArray(chunks, chunksizes)
+    out = awkwardlib.ChunkedArray(chunks, chunksizes)
+    if prefetch > 0:
+        # the first prefetch row groups are read now (concurrently, with an executor); the rest stay lazy
+        out.prefetch(0, prefetch, executor=executor)
+    return out
@@ -4,7 +4,9 @@
 
 import codecs
 import collections
+import itertools
 import numbers
+import operator
 try:
     from collections.abc import Iterable
 except ImportError:
@@ -12,6 +14,7 @@ except ImportError:
 
 import numpy
 
+import awkward.persist
 import awkward.type
 import awkward.util
 
@@ -45,6 +48,9 @@ def typeof(obj):
     else:
         return set(n for n in obj.__dict__ if not n.startswith("_")), type(obj)
 
+# exact types that typeof sends to NumberFillable (bool is not among them), for appending whole lists at once
+_numbertypes = frozenset([int, float])
+
 class Fillable(object):
     def __init__(self, awkwardlib):
         self.awkwardlib = awkwardlib
@@ -184,14 +190,29 @@ class JaggedFillable(Fillable):
             return MaskedFillable(self, 0, self.awkwardlib).append(obj, tpe)
 
         if self.matches(tpe):
-            for x in obj:
-                self.content = self.content.append(x, typeof(x))
+            if type(self.content) is NumberFillable and self._extendnumbers(obj):
+                pass
+            else:
+                for x in obj:
+                    self.content = self.content.append(x, typeof(x))
             self.offsets.append(len(self.content))
             return self
 
         else:
             return UnionFillable(self, self.awkwardlib).append(obj, tpe)
 
+    def _extendnumbers(self, obj):
+        # numbers into numbers need no per-element type dispatch
+        if isinstance(obj, numpy.ndarray):
+            if len(obj.shape) == 1 and obj.dtype.kind in "iuf":
+                self.content.data.extend(obj.tolist())
+                return True
+        elif isinstance(obj, list):
+            if set(map(type, obj)).issubset(_numbertypes):
+                self.content.data.extend(obj)
+                return True
+        return False
+
     def finalize(self, **options):
         return self.awkwardlib.JaggedArray.fromoffsets(self.offsets, self.content.finalize(**options))
 
@@ -415,7 +436,7 @@ class UnionFillable(Fillable):
         return self.awkwardlib.UnionArray(self.tags, self.index, [x.finalize(**options) for x in self.contents])
 
 def _checkoptions(options):
-    unrecognized = set(options).difference(["dictencoding", "maskedwhen"])
+    unrecognized = set(options).difference(["dictencoding", "maskedwhen", "dedup"])
     if len(unrecognized) != 0:
         raise TypeError("unrecognized options: {0}".format(", ".join(sorted(unrecognized))))
 
@@ -423,9 +444,87 @@ def fromiter(iterable, awkwardlib=None, **options):
     _checkoptions(options)
 
     awkwardlib = awkward.util.awkwardlib(awkwardlib)
+
+    if not isinstance(iterable, list):
+        iterable = list(iterable)
+    out = None
+    if options.get("dedup", False):
+        out = _fromshared(iterable, awkwardlib, options)
+    if out is None:
+        out = _fromnumbers(iterable, awkwardlib)
+    if out is None:
+        out = _fromrecords(iterable, awkwardlib, options)
+    if out is not None:
+        return out
+
     fillable = UnknownFillable(awkwardlib)
 
     for obj in iterable:
         fillable = fillable.append(obj, typeof(obj))
 
     return fillable.finalize(**options)
+
+def fromjson(source, awkwardlib=None, **options):
+    # source is JSON text (str or bytes) or a file-like object containing a JSON array;
+    # parsed with orjson if available, then converted like fromiter
+    if hasattr(source, "read"):
+        source = source.read()
+    data = awkward.persist.jsonloads(source)
+    if not isinstance(data, list):
+        raise ValueError("fromjson requires a JSON array, not {0}".format(type(data).__name__))
+    return fromiter(data, awkwardlib=awkwardlib, **options)
+
+def _fromnumbers(data, awkwardlib):
+    # numbers and lists of numbers (the most common inputs) are classified in one pass and built column-wise;
+    # anything else returns None for the general Fillables
+    if len(data) == 0:
+        return None
+
+    types = set(map(type, data))
+    if types.issubset(_numbertypes):
+        return awkwardlib.numpy.array(data)
+
+    elif types == set([list]):
+        content = list(itertools.chain.from_iterable(data))
+        if len(content) == 0 or not set(map(type, content)).issubset(_numbertypes):
+            return None
+        counts = awkwardlib.numpy.fromiter(map(len, data), dtype=awkwardlib.JaggedArray.INDEXTYPE, count=len(data))
+        return awkwardlib.JaggedArray.fromcounts(counts, awkwardlib.numpy.array(content))
+
+    else:
+        return None
+
+def _fromrecords(data, awkwardlib, options):
+    # dicts that all have the same keys are split into columns, and each column is built on its own
+    # (a TableFillable fills its columns independently, so the result is the same)
+    if len(data) == 0 or type(data[0]) is not dict or len(data[0]) == 0:
+        return None
+
+    keys = data[0].keys()
+    if any(not isinstance(x, str) for x in keys) or not all(type(x) is dict and x.keys() == keys for x in data):
+        return None
+
+    return awkwardlib.Table.frompairs([(n, fromiter(list(map(operator.itemgetter(n), data)), awkwardlib, **options)) for n in sorted(keys)], 0)
+
+def _fromshared(data, awkwardlib, options):
+    # with dedup=True, a container that appears more than once (the same Python object, by id) is converted once
+    # and referenced through an IndexedArray; returns None if nothing is shared
+    positions = {}
+    uniques = []
+    index = []
+    for x in data:
+        tpe = typeof(x)
+        if tpe is None or (isinstance(tpe, type) and issubclass(tpe, SimpleFillable)):
+            index.append(len(uniques))
+            uniques.append(x)
+        else:
+            i = positions.get(id(x))
+            if i is None:
+                i = positions[id(x)] = len(uniques)
+                uniques.append(x)
+            index.append(i)
+
+    if len(uniques) == len(data):
+        return None
+    else:
+        return awkwardlib.IndexedArray(awkwardlib.numpy.array(index, dtype=awkwardlib.IndexedArray.INDEXTYPE), fromiter(uniques, awkwardlib, **options))
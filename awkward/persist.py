@@ -23,8 +23,26 @@ import numpy
 import awkward.type
 import awkward.version
 
+try:
+    # ISA-L writes the same zlib format (read back with zlib.decompress), several times faster
+    from isal.isal_zlib import compress as zlibcompress
+except ImportError:
+    zlibcompress = zlib.compress
+
+try:
+    # orjson parses schemas several times faster, but rejects the NaN/Infinity that json.dumps may have written
+    import orjson
+except ImportError:
+    jsonloads = json.loads
+else:
+    def jsonloads(string):
+        try:
+            return orjson.loads(string)
+        except ValueError:
+            return json.loads(string)
+
 compression = [
-        {"minsize": 8192, "types": [numpy.bool_, numpy.bool, numpy.integer], "contexts": "*", "pair": (zlib.compress, ("zlib", "decompress"))},
+        {"minsize": 8192, "kinds": "biu", "contexts": "*", "pair": (zlibcompress, ("zlib", "decompress"))},
     ]
 
 whitelist = [
@@ -74,15 +92,31 @@ def spec2function(obj, awkwardlib="awkward", whitelist=whitelist):
         raise RuntimeError("callable not in whitelist; add it by passing a whitelist argument:\n\n    whitelist = awkward.persist.whitelist + [{0}]".format(repr(obj)))
     return gen
 
-def dtype2json(obj):
+def _dtype2json(obj):
     if obj.subdtype is not None:
         dt, sh = obj.subdtype
-        return (dtype2json(dt), sh)
+        return (_dtype2json(dt), sh)
     elif obj.names is not None:
-        return [(n, dtype2json(obj[n])) for n in obj.names]
+        return [(n, _dtype2json(obj[n])) for n in obj.names]
     else:
         return str(obj)
 
+# the same few dtypes recur in every column of a wide Table, so don't walk their fields each time
+_dtype2json_cache = {}
+_dtype2json_cachesize = 1000
+
+def dtype2json(obj):
+    try:
+        return _dtype2json_cache[obj]
+    except KeyError:
+        pass
+
+    out = _dtype2json(obj)
+    if len(_dtype2json_cache) >= _dtype2json_cachesize:
+        _dtype2json_cache.clear()
+    _dtype2json_cache[obj] = out
+    return out
+
 def json2dtype(obj):
     def recurse(obj):
         if isinstance(obj, (list, tuple)) and len(obj) > 0 and (isinstance(obj[-1], numbers.Integral) or isinstance(obj[0], str) or (isinstance(obj[-1], (list, tuple)) and all(isinstance(x, numbers.Integral) for x in obj[-1]))):
@@ -399,6 +433,7 @@ class BlobSerializer(Serializer):
     class CompressPolicy(object):
         enc2dec = {
             zlib.compress: ("zlib", "decompress"),
+            zlibcompress: ("zlib", "decompress"),
         }
 
         @classmethod
@@ -414,7 +449,7 @@ class BlobSerializer(Serializer):
             else:
                 raise TypeError("can't parse compression policy {0}".format(x))
 
-        def __init__(self, pair=None, enc=None, dec=None, minsize=0, types=object, contexts="*"):
+        def __init__(self, pair=None, enc=None, dec=None, minsize=0, types=object, kinds=None, contexts="*"):
             if pair is not None:
                 enc, dec = pair
             if dec is None:
@@ -430,25 +465,37 @@ class BlobSerializer(Serializer):
             assert callable(enc)
             assert isinstance(dec, tuple)
             assert 0 <= minsize
+            assert kinds is None or isinstance(kinds, str)
             self.enc = enc
             self.dec = dec
             self.minsize = minsize
             self.types = types
+            self.kinds = kinds
             self.contexts = contexts
+            self._matches = {}    # (dtype.type, context) -> bool; the same few recur for every array serialized
 
         @property
         def pair(self):
             return (self.enc, self.dec)
 
         def test(self, obj, context):
-            return (obj.nbytes >= self.minsize and issubclass(obj.dtype.type, tuple(self.types)) and any(fnmatch.fnmatchcase(context, p) for p in self.contexts))
+            if obj.nbytes < self.minsize:
+                return False
+            if self.kinds is not None and obj.dtype.kind not in self.kinds:
+                return False
+            key = (obj.dtype.type, context)
+            try:
+                return self._matches[key]
+            except KeyError:
+                out = self._matches[key] = issubclass(obj.dtype.type, self.types) and any(fnmatch.fnmatchcase(context, p) for p in self.contexts)
+                return out
 
     @classmethod
     def _parse_compression(cls, comp):
         if comp is None or comp is False:
             comp = []
         elif comp is True:
-            comp = [{"minsize": 0, "types": object, "contexts": "*", "pair": (zlib.compress, ("zlib", "decompress"))}]
+            comp = [{"minsize": 0, "types": object, "contexts": "*", "pair": (zlibcompress, ("zlib", "decompress"))}]
         elif not isinstance(comp, (list, tuple)):
             comp = [comp]
 
@@ -472,7 +519,7 @@ class BlobSerializer(Serializer):
             dtype = obj.dtype
 
         buf = None
-        for policy in self._parse_compression(self.compression):
+        for policy in self.compression:    # parsed in __init__
             if policy.test(obj, context):
                 buf = self.encode_call(policy.dec, self._put_raw(policy.enc(obj.ravel()), ref=obj))
                 break
@@ -496,7 +543,7 @@ def deserialize(storage, name="", awkwardlib="awkward", whitelist=whitelist, cac
         schema = schema.tostring()
     if isinstance(schema, bytes):
         schema = schema.decode("ascii")
-    schema = json.loads(schema)
+    schema = jsonloads(schema)
 
     if "awkward" not in schema:
         raise ValueError("JSON object is not an awkward-array schema (missing 'awkward' field)")
@@ -510,10 +557,18 @@ def deserialize(storage, name="", awkwardlib="awkward", whitelist=whitelist, cac
     elif len(whitelist) > 0 and isinstance(whitelist[0], str):
         whitelist = [whitelist]
 
+    # a schema names the same few functions at every node; check each against the whitelist only once
+    functions = {}
+    def function(spec):
+        key = tuple(spec)
+        if key not in functions:
+            functions[key] = spec2function(spec, awkwardlib=awkwardlib, whitelist=whitelist)
+        return functions[key]
+
     def unfill(schema):
         if isinstance(schema, dict):
             if "call" in schema and isinstance(schema["call"], list) and len(schema["call"]) > 0:
-                gen = spec2function(schema["call"], awkwardlib=awkwardlib, whitelist=whitelist)
+                gen = function(schema["call"])
                 args = [unfill(x) for x in schema.get("args", [])]
 
                 kwargs = {}
@@ -548,7 +603,7 @@ def deserialize(storage, name="", awkwardlib="awkward", whitelist=whitelist, cac
                 out = json2dtype(schema["dtype"])
 
             elif "function" in schema:
-                out = spec2function(schema["function"], awkwardlib=awkwardlib, whitelist=whitelist)
+                out = function(schema["function"])
 
             elif "json" in schema:
                 out = schema["json"]
@@ -580,7 +635,7 @@ def keys(storage, name="", subschemas=True):
         schema = schema.tostring()
     if isinstance(schema, bytes):
         schema = schema.decode("ascii")
-    schema = json.loads(schema)
+    schema = jsonloads(schema)
 
     prefix = schema.get("prefix", "")
 
@@ -310,7 +310,7 @@ def topandas_flatten(array):
 
                     if starts is None:
                         starts, stops = tmp.starts, tmp.stops
-                    elif not numpy.array_equal(starts, tmp.starts) or not numpy.array_equal(stops, tmp.stops):
+                    elif not (JaggedArray._sameview(starts, tmp.starts) or numpy.array_equal(starts, tmp.starts)) or not (JaggedArray._sameview(stops, tmp.stops) or numpy.array_equal(stops, tmp.stops)):
                         raise ValueError("this array has more than one jagged array structure")
                     if out is None:
                         out = JaggedArray(starts, stops, Table({n: tmp.content}))
@@ -42,6 +42,24 @@ class Test(unittest.TestCase):
                 maskedjets = awkward.MaskedArray([False, False, True], jets, maskedwhen=True)
                 assert list(awkward.arrow.toarrow(maskedjets)) == [[{"fPt": 10.0, "fEta": -3.0, "fPhi": -1.5, "fMass": 60.0}, {"fPt": 20.0, "fEta": -2.0, "fPhi": 0.0, "fMass": 70.0}, {"fPt": 30.0, "fEta": 2.0, "fPhi": 1.5, "fMass": 80.0}], [], [{"fPt": None, "fEta": None, "fPhi": None, "fMass": None}, {"fPt": None, "fEta": None, "fPhi": None, "fMass": None}]]
 
+    def test_arrow_toarrow_masked(self):
+        if pyarrow is None:
+            pytest.skip("unable to import pyarrow")
+        else:
+            a = awkward.MaskedArray([False, True, False, False, True, False, False, False, False], numpy.arange(9, dtype=numpy.float64))
+            assert awkward.arrow.toarrow(a).to_pylist() == [0.0, None, 2.0, 3.0, None, 5.0, 6.0, 7.0, 8.0]
+            assert awkward.arrow.toarrow(a).null_count == 2
+            b = awkward.JaggedArray.fromcounts([3, 0, 6], a)
+            assert awkward.arrow.toarrow(b).to_pylist() == [[0.0, None, 2.0], [], [3.0, None, 5.0, 6.0, 7.0, 8.0]]
+
+    def test_arrow_toarrow_masked_union(self):
+        if pyarrow is None:
+            pytest.skip("unable to import pyarrow")
+        else:
+            a = awkward.UnionArray.fromtags([0, 1, 2, 1, 0, 2, 2], [numpy.array([1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7]), numpy.array([10, 20, 30, 40, 50, 60, 70]), numpy.array([100.0, 200.0, 300.0, 400.0, 500.0, 600.0, 700.0])])
+            b = awkward.MaskedArray([False, True, False, False, True, False, True], a)
+            assert awkward.arrow.toarrow(b).to_pylist() == [1.1, None, 100.0, 20, None, 200.0, None]
+
     def test_arrow_toarrow_string(self):
         if pyarrow is None:
             pytest.skip("unable to import pyarrow")
@@ -82,6 +100,8 @@ class Test(unittest.TestCase):
         else:
             a = pyarrow.array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
             assert awkward.arrow.fromarrow(a).tolist() == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+            assert numpy.shares_memory(awkward.arrow.fromarrow(a).offsets, numpy.frombuffer(a.buffers()[1], dtype=numpy.int32))
+            assert awkward.arrow.fromarrow(a[1:]).tolist() == [[], [4.4, 5.5]]
 
     def test_arrow_nested_nested_array(self):
         if pyarrow is None:
@@ -241,6 +261,8 @@ class Test(unittest.TestCase):
         else:
             a = pyarrow.chunked_array([pyarrow.array(["one", "two", "three", "four", "five"]), pyarrow.array(["six", "seven", "eight"])])
             assert awkward.arrow.fromarrow(a).tolist() == ["one", "two", "three", "four", "five", "six", "seven", "eight"]
+            a = pyarrow.chunked_array([pyarrow.array(["one", "two"]), pyarrow.array([], pyarrow.string())])
+            assert awkward.arrow.fromarrow(a).tolist() == ["one", "two"]
 
     def test_arrow_nested_strings(self):
         if pyarrow is None:
@@ -326,6 +348,30 @@ class Test(unittest.TestCase):
             a = pyarrow.DictionaryArray.from_arrays(pyarrow.array([0, 0, 2, 2, 1, 0, 2, 1, 1]), pyarrow.array(["one", None, "three"]))
             assert awkward.arrow.fromarrow(a).tolist() == ["one", "one", "three", "three", None, "one", "three", None, None]
 
+    def test_arrow_toarrow_dictencode(self):
+        if pyarrow is None:
+            pytest.skip("unable to import pyarrow")
+        else:
+            a = awkward.IndexedMaskedArray([-1, 0, 2, -1, 1], numpy.array([1.1, 2.2, 3.3]))
+            assert isinstance(awkward.arrow.toarrow(a, dictencode=True), pyarrow.DictionaryArray)
+            assert awkward.arrow.toarrow(a, dictencode=True).to_pylist() == awkward.arrow.toarrow(a).to_pylist() == [None, 1.1, 3.3, None, 2.2]
+            b = awkward.MaskedArray([False, False, True], awkward.JaggedArray.fromcounts([2, 0, 3], a))
+            assert awkward.arrow.toarrow(b, dictencode=True).to_pylist() == [[None, 1.1], [], [None, None, None]]
+
+    def test_arrow_popbuffers_fortype(self):
+        if pyarrow is None:
+            pytest.skip("unable to import pyarrow")
+        else:
+            for a in [pyarrow.array([1.1, 2.2, None, 4.4]),
+                      pyarrow.array([[1, 2, 3], [], None, [4, None]]),
+                      pyarrow.array([True, None, False, True, True, False, False, True, True]),
+                      pyarrow.array(["one", None, "three"]),
+                      pyarrow.array([b"one", b"two", None]),
+                      pyarrow.array([["one", "two"], [], None]),
+                      pyarrow.array(["one", "two", "one"]).dictionary_encode()]:
+                popbuffers = awkward.arrow._popbuffers_fortype(a.type)
+                assert popbuffers(awkward, a, len(a)).tolist() == awkward.arrow.fromarrow(a).tolist() == a.to_pylist()
+
     def test_arrow_batch(self):
         if pyarrow is None:
             pytest.skip("unable to import pyarrow")
@@ -360,6 +406,17 @@ class Test(unittest.TestCase):
                 ["a", "b", "c", "d", "e"])])
             assert awkward.arrow.fromarrow(a).tolist() == [{"a": 1.1, "b": [1, 2, 3], "c": {"x": 1, "y": 1.1}, "d": {"x": 1, "y": 1.1}, "e": [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}, {"x": 3, "y": 3.3}]}, {"a": 2.2, "b": [], "c": {"x": 2, "y": 2.2}, "d": None, "e": []}, {"a": 3.3, "b": [4, 5], "c": {"x": 3, "y": 3.3}, "d": None, "e": [{"x": 4, "y": None}, {"x": 5, "y": 5.5}]}, {"a": None, "b": [None], "c": {"x": 4, "y": None}, "d": {"x": 4, "y": None}, "e": [None]}, {"a": 5.5, "b": [6], "c": {"x": 5, "y": 5.5}, "d": {"x": 5, "y": 5.5}, "e": [{"x": 6, "y": 6.6}]}, {"a": 1.1, "b": [1, 2, 3], "c": {"x": 1, "y": 1.1}, "d": {"x": 1, "y": 1.1}, "e": [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}, {"x": 3, "y": 3.3}]}, {"a": 2.2, "b": [], "c": {"x": 2, "y": 2.2}, "d": None, "e": []}, {"a": 3.3, "b": [4, 5], "c": {"x": 3, "y": 3.3}, "d": None, "e": [{"x": 4, "y": None}, {"x": 5, "y": 5.5}]}, {"a": None, "b": [None], "c": {"x": 4, "y": None}, "d": {"x": 4, "y": None}, "e": [None]}, {"a": 5.5, "b": [6], "c": {"x": 5, "y": 5.5}, "d": {"x": 5, "y": 5.5}, "e": [{"x": 6, "y": 6.6}]}]
 
+    def test_arrow_table_executor(self):
+        if pyarrow is None:
+            pytest.skip("unable to import pyarrow")
+        else:
+            futures = pytest.importorskip("concurrent.futures")
+            batch = pyarrow.RecordBatch.from_arrays([pyarrow.array([1.1, 2.2, None]), pyarrow.array([[1, 2], [], [3]]), pyarrow.array([True, False, True])], ["a", "b", "c"])
+            a = pyarrow.Table.from_batches([batch, batch])
+            with futures.ThreadPoolExecutor(2) as executor:
+                assert awkward.arrow.fromarrow(batch, executor=executor).tolist() == awkward.arrow.fromarrow(batch).tolist()
+                assert awkward.arrow.fromarrow(a, executor=executor).tolist() == awkward.arrow.fromarrow(a).tolist() == [{"a": 1.1, "b": [1, 2], "c": True}, {"a": 2.2, "b": [], "c": False}, {"a": None, "b": [3], "c": True}] * 2
+
     def test_arrow_nonnullable_table(self):
         if pyarrow is None:
             pytest.skip("unable to import pyarrow")
@@ -455,3 +512,85 @@ def test_arrow_writeparquet2(tmpdir):
     assert isinstance(cstuff.content.content, awkward.BitMaskedArray) and isinstance(dstuff.content.content, awkward.BitMaskedArray)
     assert cstuff.content.content.boolmask().tolist() == dstuff.content.content.boolmask().tolist()
     assert isinstance(cstuff.content.content.content, numpy.ndarray) and isinstance(dstuff.content.content.content, numpy.ndarray)
+
+def test_arrow_readparquet_dictionary(tmpdir):
+    import pyarrow.parquet
+    filename = os.path.join(str(tmpdir), "tmp.parquet")
+    pyarrow.parquet.write_table(pyarrow.Table.from_arrays([pyarrow.array(["one", "two", "one", None, "three"]), pyarrow.array([1, 2, 3, 4, 5])], ["name", "x"]), filename)
+
+    a = awkward.fromparquet(filename, read_dictionary=["name"], persistvirtual=True)
+    assert a["name"].tolist() == ["one", "two", "one", None, "three"]
+    assert a["x"].tolist() == [1, 2, 3, 4, 5]
+    name = a["name"].chunks[0].array
+    assert isinstance(name, awkward.BitMaskedArray) and isinstance(name.content, awkward.IndexedArray)
+    assert name.content.content.tolist() == ["one", "two", "three"]
+
+    storage = {}
+    awkward.serialize(a, storage)
+    b = awkward.deserialize(storage, whitelist=awkward.persist.whitelist + [["builtins", "str"]])
+    assert isinstance(b["name"].chunks[0].array.content, awkward.IndexedArray)
+    assert b["name"].tolist() == ["one", "two", "one", None, "three"]
+
+def test_arrow_readparquet_columns_filters(tmpdir):
+    import pyarrow.parquet
+    filename = os.path.join(str(tmpdir), "tmp.parquet")
+    pyarrow.parquet.write_table(pyarrow.Table.from_arrays([pyarrow.array(list(range(30))), pyarrow.array([[i] for i in range(30)])], ["x", "y"]), filename, row_group_size=10)
+
+    a = awkward.fromparquet(filename, columns=["x"])
+    assert a.columns == ["x"]
+    assert a["x"].tolist() == list(range(30))
+
+    a = awkward.fromparquet(filename, filters=[("x", ">=", 12), ("x", "<", 15)])
+    assert a.chunksizes == [10]
+    assert a["y"].tolist() == [[i] for i in range(10, 20)]
+    assert len(awkward.fromparquet(filename, filters=[("x", ">", 100)])) == 0
+    assert awkward.fromparquet(filename, filters=[[("x", "==", 5)], [("x", "in", [25, 100])]]).chunksizes == [10, 10]
+
+    pytest.raises(ValueError, lambda: awkward.fromparquet(filename, columns=["z"]))
+    pytest.raises(ValueError, lambda: awkward.fromparquet(filename, filters=[("y", "==", 1)]))
+
+def test_arrow_readparquet_prefetch(tmpdir):
+    import pyarrow.parquet
+    futures = pytest.importorskip("concurrent.futures")
+    filename = os.path.join(str(tmpdir), "tmp.parquet")
+    pyarrow.parquet.write_table(pyarrow.Table.from_arrays([pyarrow.array(list(range(30))), pyarrow.array([[i] for i in range(30)])], ["x", "y"]), filename, row_group_size=10)
+
+    a = awkward.fromparquet(filename, prefetch=2)
+    assert [chunk["x"].ismaterialized and chunk["y"].ismaterialized for chunk in a.chunks] == [True, True, False]
+    assert a["x"].tolist() == list(range(30))
+    assert a["y"].tolist() == [[i] for i in range(30)]
+
+    a = awkward.fromparquet(filename)
+    assert not any(chunk["x"].ismaterialized for chunk in a.chunks)
+    assert a.prefetch(1, 2) is a
+    assert [chunk["x"].ismaterialized for chunk in a.chunks] == [False, True, False]
+    a.prefetch()
+    assert all(chunk["x"].ismaterialized for chunk in a.chunks)
+
+    # many row groups read at once, from per-thread readers of the named file and from one shared file object
+    pyarrow.parquet.write_table(pyarrow.Table.from_arrays([pyarrow.array(list(range(1000))), pyarrow.array([[i, i] for i in range(1000)])], ["x", "y"]), filename, row_group_size=10)
+    with futures.ThreadPoolExecutor(8) as executor:
+        for i in range(3):
+            a = awkward.fromparquet(filename, prefetch=100, executor=executor)
+            assert all(chunk["x"].ismaterialized for chunk in a.chunks)
+            assert a["x"].tolist() == list(range(1000))
+            assert a["y"].tolist() == [[i, i] for i in range(1000)]
+        with open(filename, "rb") as file:
+            a = awkward.fromparquet(file, executor=executor).prefetch(executor=executor)
+            assert a["x"].tolist() == list(range(1000))
+            assert a["y"].tolist() == [[i, i] for i in range(1000)]
+
+def test_arrow_readparquet_evicted(tmpdir):
+    import pyarrow.parquet
+    filename = os.path.join(str(tmpdir), "tmp.parquet")
+    pyarrow.parquet.write_table(pyarrow.Table.from_arrays([pyarrow.array(list(range(30))), pyarrow.array([[i] for i in range(30)])], ["x", "y"]), filename, row_group_size=10)
+
+    # an evicted row group is read from the file again, even if the caller still holds (and has changed) the old one
+    cache = {}
+    a = awkward.fromparquet(filename, cache=cache)
+    held = a.chunks[0]["y"].array
+    held.content = numpy.zeros(10, dtype=held.content.dtype)
+    cache.clear()
+    again = a.chunks[0]["y"].array
+    assert again is not held
+    assert again.tolist() == [[i] for i in range(10)]
@@ -3,8 +3,12 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-array/blob/master/LICENSE
 
 import collections
+import io
+import json
 import unittest
 
+import numpy
+
 import awkward
 
 class S0(object):
@@ -169,6 +173,16 @@ class Test(unittest.TestCase):
         x.insert(0, None)
         assert awkward.fromiter(x).tolist() == x
 
+        x = [[1.1, 2.2], [], [3]]
+        assert awkward.fromiter(iter(x)).tolist() == x
+        assert awkward.fromiter(x).counts.tolist() == [2, 0, 1]
+
+        x = [[1, 2, 3], [], [4, None], [5, True], [6, "seven"]]
+        assert awkward.fromiter(x).tolist() == x
+
+        x = [[1.1, 2.2], numpy.array([3.3, 4.4]), numpy.array([5, 6])]
+        assert awkward.fromiter(x).tolist() == [[1.1, 2.2], [3.3, 4.4], [5.0, 6.0]]
+
     def test_generate_multijagged(self):
         x = [[[]]]
         assert awkward.fromiter(x).tolist() == x
@@ -1693,3 +1707,24 @@ class Test(unittest.TestCase):
         assert awkward.fromiter(x).tolist() == x
         x.insert(0, None)
         assert awkward.fromiter(x).tolist() == x
+
+    def test_generate_dedup(self):
+        one = {"x": 1, "y": [1.1, 2.2]}
+        two = {"x": 2, "y": []}
+        x = [one, two, one, one, None, two]
+        a = awkward.fromiter(x, dedup=True)
+        assert isinstance(a, awkward.IndexedArray)
+        assert a.index.tolist() == [0, 1, 0, 0, 2, 1]
+        assert len(a.content) == 3
+        assert a.tolist() == x
+
+        assert isinstance(awkward.fromiter([one, two], dedup=True), awkward.Table)
+        assert isinstance(awkward.fromiter([1, 1, 1], dedup=True), numpy.ndarray)
+
+    def test_generate_fromjson(self):
+        x = [{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}, {"x": 3, "y": [3.3]}]
+        assert awkward.fromjson(json.dumps(x)).tolist() == x
+        assert awkward.fromjson(json.dumps(x).encode()).tolist() == x
+        assert awkward.fromjson(io.StringIO(json.dumps([1, None, [2, 3], "four"]))).tolist() == [1, None, [2, 3], "four"]
+        assert awkward.fromjson("[1.5, NaN]")[1] != awkward.fromjson("[1.5, NaN]")[1]
+        self.assertRaises(ValueError, lambda: awkward.fromjson('{"x": 1}'))
@@ -37,6 +37,34 @@ class Test(unittest.TestCase):
         a = JaggedArray([], [], [0.0, 1.1, 2.2, 3.3, 4.4])
         assert a[:].tolist() == []
 
+    def test_jagged_counts2offsets(self):
+        assert JaggedArray.counts2offsets(numpy.array([2**30, 2**30, 2**30], dtype=numpy.int32)).tolist() == [0, 2**30, 2**31, 3 * 2**30]
+        assert JaggedArray.counts2offsets(numpy.array([], dtype=numpy.int32)).tolist() == [0]
+        self.assertRaises(ValueError, lambda: JaggedArray.fromcounts([3, -1], [0.0, 1.1]))
+
+    def test_jagged_offsets_view(self):
+        offsets = numpy.array([0, 2, 2, 5, 7, 9])
+        a = JaggedArray.fromoffsets(offsets[1:4], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        assert JaggedArray.offsetsaliased(a.starts, a.stops)
+        assert numpy.shares_memory(a.offsets, offsets)
+        assert a.tolist() == [[], [2.2, 3.3, 4.4]]
+        assert a.parents.tolist() == [-1, -1, 1, 1, 1]
+        b = JaggedArray(offsets[1:3], offsets[2:4], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        assert b.offsets.tolist() == [2, 2, 5]
+        assert not JaggedArray.offsetsaliased(offsets[1:3], offsets[3:5])
+        c = JaggedArray.fromcounts([2, 0, 0], [1.0, 2.0])[1:]
+        assert JaggedArray.offsetsaliased(c.starts, c.stops)
+        assert c.tojagged(c * 2).tolist() == [[], []]
+
+    def test_jagged_int32_offsets(self):
+        a = JaggedArray.fromcounts([3, 0, 2, 1], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5], dtype=numpy.int32)
+        assert a.offsets.dtype == numpy.dtype(numpy.int32)
+        assert a.tolist() == [[0.0, 1.1, 2.2], [], [3.3, 4.4], [5.5]]
+        assert a[1:].offsets.dtype == numpy.dtype(numpy.int32)
+        assert a.sum().tolist() == [3.3000000000000003, 0.0, 7.7, 5.5]
+        assert JaggedArray(a.starts.copy(), a.stops.copy(), a.content).offsets.dtype == numpy.dtype(numpy.int32)
+        self.assertRaises(ValueError, lambda: JaggedArray.fromcounts([2**31, 0], numpy.empty(0), dtype=numpy.int32))
+
     def test_jagged_type(self):
         a = JaggedArray([0, 3, 3, 5], [3, 3, 5, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
         assert a.type == ArrayType(4, numpy.inf, float)
@@ -63,6 +91,18 @@ class Test(unittest.TestCase):
         a = JaggedArray.fromiter([[], []])
         assert a.tojagged(a).tolist() == a.tolist()
 
+    def test_jagged_contiguous_empty(self):
+        a = JaggedArray([3, 3], [3, 3], numpy.arange(5.0))
+        assert a.tojagged(a * 2).tolist() == [[], []]
+        starts, stops = numpy.array([0, 2]), numpy.array([2, 5])
+        a = JaggedArray(starts, stops, numpy.arange(5.0))
+        assert a.offsets.tolist() == [0, 2, 5]
+        assert a.starts is starts and a.stops is stops
+        b = JaggedArray(starts, stops, numpy.arange(5.0))
+        assert b._canuseoffset()
+        assert b.starts is starts and b.stops is stops
+        assert b.offsets.tolist() == [0, 2, 5]
+
     def test_jagged_str(self):
         pass
 
@@ -135,6 +175,10 @@ class Test(unittest.TestCase):
             for stop in None, 0, 1, 2, 3, 4, 5, -1, -2, -3, -4, -5, -6:
                 for step in None, 1, 2, 3, 4, 5, -1, -2, -3, -4, -5:
                     assert a[:, start:stop:step].tolist() == [x.tolist()[start:stop:step] for x in a]
+        assert a[:, 1:3].content is a.content
+        assert a[2:, :-1].tolist() == [[200, 201, 202], [300, 301, 302, 303], [], [500], [], []]
+        assert a[a.counts > 1, 1].tolist() == [101, 201, 301, 501]
+        assert a[1:4, 1:][:, 0].tolist() == [101, 201, 301]
 
     def test_jagged_jagged(self):
         a = JaggedArray.fromoffsets([0, 3, 3, 5], JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9]))
@@ -152,6 +196,9 @@ class Test(unittest.TestCase):
         a = JaggedArray([0, 3, 3, 5], [3, 3, 5, 10], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
         assert (100 + a).tolist() == [[100.0, 101.1, 102.2], [], [103.3, 104.4], [105.5, 106.6, 107.7, 108.8, 109.9]]
         assert (numpy.array([100, 200, 300, 400]) + a).tolist() == [[100.0, 101.1, 102.2], [], [303.3, 304.4], [405.5, 406.6, 407.7, 408.8, 409.9]]
+        a.parents
+        assert (numpy.array([100, 200, 300, 400]) + a).tolist() == [[100.0, 101.1, 102.2], [], [303.3, 304.4], [405.5, 406.6, 407.7, 408.8, 409.9]]
+        assert (a[1:] + numpy.array([200, 300, 400])).tolist() == [[], [303.3, 304.4], [405.5, 406.6, 407.7, 408.8, 409.9]]
 
     def test_jagged_ufunc_object(self):
         class Z(object):
@@ -494,6 +541,11 @@ class Test(unittest.TestCase):
         a = JaggedArray([5, 2, 99, 1], [8, 7, 99, 3], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
         assert [x.tolist() for x in a] == [[5.5, 6.6, 7.7], [2.2, 3.3, 4.4, 5.5, 6.6], [], [1.1, 2.2]]
         assert [x.tolist() for x in a[:]] == [[5.5, 6.6, 7.7], [2.2, 3.3, 4.4, 5.5, 6.6], [], [1.1, 2.2]]
+        assert a[a > 3.0].tolist() == [[5.5, 6.6, 7.7], [3.3, 4.4, 5.5, 6.6], [], []]
+        assert a[[3, 0]]._isvalid
+        assert a[[3, 0]].counts.tolist() == [2, 3]
+        b = JaggedArray([5, 2], [8, 7, 9, 9], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
+        assert b[-1:].tolist() == [[2.2, 3.3, 4.4, 5.5, 6.6]]
 
     def test_jagged_get2d(self):
         a = JaggedArray.fromoffsets([0, 3, 3, 8, 10, 10], [[0.0, 0.0], [1.1, 1.1], [2.2, 2.2], [3.3, 3.3], [4.4, 4.4], [5.5, 5.5], [6.6, 6.6], [7.7, 7.7], [8.8, 8.8], [9.9, 9.9]])
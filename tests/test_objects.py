@@ -59,3 +59,22 @@ class Test(unittest.TestCase):
         assert a[::2].tolist() == [Point(numpy.array([1.1, 2.2, 3.3]).tobytes()), Point(numpy.array([7.7, 8.8, 9.9]).tobytes())]
         assert a[[True, False, True]].tolist() == [Point(numpy.array([1.1, 2.2, 3.3]).tobytes()), Point(numpy.array([7.7, 8.8, 9.9]).tobytes())]
         assert a[[2, 0]].tolist() == [Point(numpy.array([7.7, 8.8, 9.9]).tobytes()), Point(numpy.array([1.1, 2.2, 3.3]).tobytes())]
+
+    def test_string_iter(self):
+        a = StringArray.fromiter(["one", "", "three", "four"])
+        assert list(a) == ["one", "", "three", "four"]
+        assert list(a[[3, 0]]) == ["four", "one"]
+        assert list(StringArray.fromiter(["", ""])) == ["", ""]
+        assert list(StringArray.fromiter(["one", "twö", "three"])) == ["one", "twö", "three"]
+        assert list(StringArray.fromiter([b"one", b"t\xff"], encoding=None)) == [b"one", b"t\xff"]
+
+    def test_string_iter_sparse(self):
+        a = StringArray.fromiter(["x" * 100] * 1000 + ["one", "two"])
+        assert list(a[[0, 1001]]) == ["x" * 100, "two"]
+        assert list(a[[1000, 1001, 0]]) == ["one", "two", "x" * 100]
+        assert list(a[numpy.array([False] * 1000 + [True, True])]) == ["one", "two"]
+        b = StringArray.fromiter([b"one"] + [b"\xff" * 100] * 1000 + [b"t\xff"], encoding=None)
+        assert list(b[[0, 1001]]) == [b"one", b"t\xff"]
+        c = StringArray.fromiter(["one"] + ["twö" * 100] * 1000 + ["three"])
+        assert list(c[[0, 1001]]) == ["one", "three"]
+        assert list(c[[1, 0]]) == ["twö" * 100, "one"]
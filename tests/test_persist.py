@@ -41,6 +41,15 @@ class Test(unittest.TestCase):
         b = pickle.loads(pickle.dumps(a))
         assert a.tolist() == b.tolist()
 
+    def test_pickle_outofband(self):
+        if pickle.HIGHEST_PROTOCOL < 5:
+            return
+        a = awkward.JaggedArray.fromcounts(numpy.full(5000, 2), numpy.arange(10000, dtype=numpy.float64))
+        buffers = []
+        b = pickle.loads(pickle.dumps(a, protocol=5, buffer_callback=buffers.append), buffers=buffers)
+        assert a.tolist() == b.tolist()
+        assert any(numpy.shares_memory(numpy.asarray(x), a.content) for x in buffers)
+
     def test_uncompressed_numpy(self):
         storage = {}
         a = numpy.arange(100, dtype=">u2").reshape(-1, 5)
@@ -59,6 +68,17 @@ class Test(unittest.TestCase):
         assert a.dtype == b.dtype
         assert a.shape == b.shape
 
+    def test_compressed_kinds(self):
+        storage = {}
+        a = numpy.arange(10000, dtype=numpy.int32)
+        b = numpy.arange(10000, dtype=numpy.float64)
+        serialize(a, storage, name="a")
+        serialize(b, storage, name="b")
+        assert b"zlib" in storage["a"]
+        assert b"zlib" not in storage["b"]
+        assert numpy.array_equal(deserialize(storage, name="a"), a)
+        assert numpy.array_equal(deserialize(storage, name="b"), b)
+
     def test_crossref(self):
         starts = [1, 0, 4, 0, 0]
         stops  = [4, 0, 5, 0, 0]
@@ -209,3 +209,24 @@ class Test(unittest.TestCase):
         a = Table(column_dict)
         b = [{key: row[key] for key in row} for row in a]
         assert b == [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+
+    def test_table_project_columns(self):
+        a = Table(x=[0, 1, 2, 3, 4], y=[0.0, 1.1, 2.2, 3.3, 4.4], z=[5, 6, 7, 8, 9])
+        b = a[["z", "x"]]
+        assert b.columns == ["z", "x"]
+        assert b["x"] is a["x"]
+        assert b.tolist() == [{"z": 5, "x": 0}, {"z": 6, "x": 1}, {"z": 7, "x": 2}, {"z": 8, "x": 3}, {"z": 9, "x": 4}]
+        assert a[1:4][["y"]].tolist() == [{"y": 1.1}, {"y": 2.2}, {"y": 3.3}]
+        assert a[2][["x", "z"]].tolist() == {"x": 2, "z": 7}
+        self.assertRaises(ValueError, lambda: a[["x", "w"]])
+
+    def test_table_tolist(self):
+        a = Table(x=[1, 2, 3], y=[1.1, 2.2, 3.3])
+        assert a.tolist() == [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}, {"x": 3, "y": 3.3}]
+        assert a[1:].tolist() == [{"x": 2, "y": 2.2}, {"x": 3, "y": 3.3}]
+        assert a[[2, 0]].tolist() == [{"x": 3, "y": 3.3}, {"x": 1, "y": 1.1}]
+        assert Table([1, 2], [1.1, 2.2]).tolist() == [(1, 1.1), (2, 2.2)]
+        assert Table(j=JaggedArray.fromcounts([2, 0], [1, 2])).tolist() == [{"j": [1, 2]}, {"j": []}]
+        b = Table(o=numpy.array([numpy.arange(2), None], dtype=object))
+        assert b.tolist() == [{"o": [0, 1]}, {"o": None}]
+        assert b.tolist() == [x.tolist() for x in b]